@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark for translate_batch
+
+Renders a commentary feed in every supported language, comparing one
+TranslationEngine.translate call per line and language with a single
+translate_batch call. Each side gets its own engine with an empty result
+cache, so the batch gain measured here comes from tokenizing each line
+once for all languages. A second batch over the same feed shows the
+cache hits that repeated commentary gets.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.multilingual_commentary import MultilingualCommentary
+from utils.translation import TranslationEngine
+
+
+def warm_engine(languages):
+    """An engine with every language's lookup tables built and an empty cache"""
+    engine = TranslationEngine()
+    engine.translate_batch(["LAP 1: Max Verstappen leads by 1.2 seconds"], languages)
+    engine.cache.clear()
+    return engine
+
+
+def main():
+    """Run the per-call versus batch comparison"""
+    lines = generate_commentary(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
+    languages = MultilingualCommentary().get_supported_languages()
+    cells = len(lines) * len(languages)
+
+    print(f"🏎️ Translating {len(lines)} lines x {len(languages)} languages "
+          f"({len(set(lines))} distinct lines)")
+
+    engine = warm_engine(languages)
+    start = time.perf_counter()
+    per_call = [[engine.translate(line, language) for language in languages] for line in lines]
+    per_call_time = time.perf_counter() - start
+
+    engine = warm_engine(languages)
+    start = time.perf_counter()
+    batched = engine.translate_batch(lines, languages)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repeated = engine.translate_batch(lines, languages)
+    repeat_time = time.perf_counter() - start
+
+    assert batched == per_call, "translate_batch output differs from translate"
+    assert repeated == per_call, "cached translate_batch output differs from translate"
+
+    print(f"Per call: {per_call_time:.3f}s ({cells / per_call_time:,.0f} translations/s)")
+    print(f"Batch:    {batch_time:.3f}s ({cells / batch_time:,.0f} translations/s)")
+    print(f"Speedup:  {per_call_time / batch_time:.1f}x")
+    print(f"Batch again from the cache: {repeat_time:.3f}s ({cells / repeat_time:,.0f} translations/s)")
+
+
+if __name__ == "__main__":
+    main()
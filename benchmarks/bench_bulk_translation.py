@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for bulk archive translation
+
+Translates a synthetic race archive with 1, 2, 4 and 8 worker processes
+and reports events per second for each.
+"""
+
+import io
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.commentary_stream import translate_jsonl, translate_jsonl_parallel
+
+LANGUAGES = ["Spanish", "French", "Simplified"]
+WORKER_COUNTS = [1, 2, 4, 8]
+
+
+def main():
+    """Run the scaling benchmark"""
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    archive = "".join(json.dumps({"ts": i, "text": line}) + "\n"
+                      for i, line in enumerate(generate_commentary(events)))
+
+    print(f"🏎️ Translating {events} archived events into {', '.join(LANGUAGES)}")
+    print(f"   ({os.cpu_count()} CPU cores available)")
+    print(f"{'Workers':<10}{'Time (s)':>12}{'Events/s':>14}{'Scaling':>10}")
+
+    baseline = None
+    for workers in WORKER_COUNTS:
+        output = io.StringIO()
+        start = time.perf_counter()
+        if workers == 1:
+            translate_jsonl(io.StringIO(archive), output, LANGUAGES)
+        else:
+            translate_jsonl_parallel(io.StringIO(archive), output, LANGUAGES, workers=workers)
+        elapsed = time.perf_counter() - start
+
+        baseline = baseline or elapsed
+        print(f"{workers:<10}{elapsed:>12.2f}{events / elapsed:>14,.0f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
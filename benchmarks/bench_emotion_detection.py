@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for face based emotion detection
+
+Builds a webcam-sized sample clip from one.jpg (shifted and brightness
+varied copies of the stored photo) and runs the detector frame by frame
+and in batches, reporting frames per second against the 15 FPS target.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from utils.emotion_detection import EmotionDetector
+
+SAMPLE_IMAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "one.jpg")
+TARGET_FPS = 15
+
+
+def make_clip(frame_count, size=(640, 480), seed=7):
+    """Webcam-sized frames cut from the sample photo with small camera motion"""
+    rng = np.random.default_rng(seed)
+    width, height = size
+    photo = cv2.imread(SAMPLE_IMAGE)
+    window_width, window_height = 600, 450
+
+    frames = []
+    for _ in range(frame_count):
+        x = rng.integers(0, photo.shape[1] - window_width + 1)
+        y = rng.integers(0, 80)
+        frame = cv2.resize(photo[y:y + window_height, x:x + window_width], size, interpolation=cv2.INTER_AREA)
+        frames.append(cv2.convertScaleAbs(frame, alpha=rng.uniform(0.8, 1.2), beta=rng.uniform(-20, 20)))
+    return frames
+
+
+def measure(detector, frames, batch_size):
+    """Run the clip through the detector and return (fps, results)"""
+    start = time.perf_counter()
+    results = []
+    for first in range(0, len(frames), batch_size):
+        results += detector.detect_emotions_batch(frames[first:first + batch_size])
+    return len(frames) / (time.perf_counter() - start), results
+
+
+def main():
+    """Run the benchmark"""
+    frames = make_clip(int(sys.argv[1]) if len(sys.argv) > 1 else 64)
+    detector = EmotionDetector()
+
+    start = time.perf_counter()
+    detector.detect_emotion_from_image(frames[0])
+    print(f"😊 Model loaded and warmed up in {time.perf_counter() - start:.1f} s, {len(frames)} frames of 640x480")
+
+    for batch_size in (1, 4, 8):
+        fps, results = measure(detector, frames, batch_size)
+        faces = sum(1 for _, intensity in results if intensity > 0)
+        emotions = sorted({emotion for emotion, intensity in results if intensity > 0})
+        status = "✅" if fps >= TARGET_FPS else "❌"
+        print(f"{status} Batch {batch_size}: {fps:5.1f} FPS, faces in {faces}/{len(frames)} frames, "
+              f"emotions {emotions}")
+
+
+if __name__ == "__main__":
+    main()
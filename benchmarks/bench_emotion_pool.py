@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the shared emotion inference pool
+
+Simulates several fans clicking in the Emotional Mirror at once. Reports
+what loading a fresh model per click used to cost, then the per-click
+latency and throughput when every session submits frames to the shared,
+warmed-up pool.
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.bench_emotion_detection import make_clip
+from utils.emotion_detection import EmotionDetector, EmotionInferencePool, load_fer_emotion_model
+
+
+def run_sessions(pool, frames, sessions, clicks):
+    """Each session thread detects emotion on one frame per click, returns latencies"""
+    latencies = []
+    lock = threading.Lock()
+
+    def session(offset):
+        detector = EmotionDetector(pool=pool)
+        for click in range(clicks):
+            start = time.perf_counter()
+            detector.detect_emotion_from_image(frames[(offset + click) % len(frames)])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=session, args=(index,)) for index in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def main():
+    """Run the benchmark"""
+    frames = make_clip(32)
+
+    start = time.perf_counter()
+    load_fer_emotion_model()
+    print(f"😊 Loading the model per click used to cost {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    pool = EmotionInferencePool()
+    pool.predict(frames[:1])
+    for sessions in (1, 4, 16):
+        start = time.perf_counter()
+        latencies = run_sessions(pool, frames, sessions, clicks=4)
+        elapsed = time.perf_counter() - start
+        print(f"{sessions:2d} sessions: per-click p50 {np.percentile(latencies, 50) * 1000:6.0f} ms, "
+              f"p95 {np.percentile(latencies, 95) * 1000:6.0f} ms, {len(latencies) / elapsed:5.1f} frames/s")
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
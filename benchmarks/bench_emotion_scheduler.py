@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the emotion frame scheduler
+
+Plays a webcam-like clip cut from one.jpg (slow camera drift with an
+occasional jump) through the scheduler and through full detection on
+every frame, reporting frames per second, detector duty cycle and the
+adaptive detection interval.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+
+from benchmarks.bench_emotion_detection import SAMPLE_IMAGE
+from utils.emotion_detection import EmotionDetector, EmotionFrameScheduler
+
+
+def make_drifting_clip(frame_count, size=(640, 480)):
+    """Frames panning slowly across the sample photo, jumping every 50 frames"""
+    photo = cv2.imread(SAMPLE_IMAGE)
+    window_width, window_height = 600, 450
+    frames = []
+    for index in range(frame_count):
+        x = int((index % 50) * 1.5) % (photo.shape[1] - window_width + 1)
+        y = 40 + (30 if (index // 50) % 2 else 0)
+        frames.append(cv2.resize(photo[y:y + window_height, x:x + window_width], size,
+                                 interpolation=cv2.INTER_AREA))
+    return frames
+
+
+def main():
+    """Run the benchmark"""
+    frames = make_drifting_clip(int(sys.argv[1]) if len(sys.argv) > 1 else 150)
+    detector = EmotionDetector()
+    detector.detect_emotion_from_image(frames[0])
+
+    start = time.perf_counter()
+    full = [detector.detect_emotion_from_image(frame) for frame in frames]
+    full_fps = len(frames) / (time.perf_counter() - start)
+
+    scheduler = EmotionFrameScheduler(detector, target_fps=30, stats_window=len(frames))
+    start = time.perf_counter()
+    scheduled = [scheduler.process(frame) for frame in frames]
+    scheduled_fps = len(frames) / (time.perf_counter() - start)
+    stats = scheduler.stats()
+
+    agreement = np.mean([result["emotion"] == emotion for result, (emotion, _) in zip(scheduled, full)])
+    print(f"😊 {len(frames)} frames of 640x480")
+    print(f"Every frame:  {full_fps:5.1f} FPS")
+    print(f"Scheduled:    {scheduled_fps:5.1f} FPS, detector duty cycle {stats['duty_cycle']:.0%}, "
+          f"k={stats['k']}, detect {stats['detect_ms']:.1f} ms, track {stats['track_ms']:.1f} ms")
+    print(f"Emotion agrees with full detection on {agreement:.0%} of frames")
+
+
+if __name__ == "__main__":
+    main()
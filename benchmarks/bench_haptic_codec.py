@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the binary haptic stream encoding
+
+Renders a full race track and sends it as 200 ms chunks, once as JSON
+objects holding the amplitudes as a list of floats (the shape of
+HapticSimulator.trigger_event) and once as binary frames. Reports bytes
+per second of race, encode and decode time, and the quantization error.
+"""
+
+import json
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from benchmarks.bench_haptic_track import make_race_events
+from utils.haptic_codec import decode_stream, encode_waveform
+from utils.haptic_track import HapticTrack
+
+
+def main():
+    """Run the benchmark"""
+    track = HapticTrack(make_race_events(int(sys.argv[1]) if len(sys.argv) > 1 else 3000))
+
+    start = time.perf_counter()
+    json_bytes = sum(len(json.dumps({"timestamp": timestamp, "pattern": chunk.tolist()}).encode("utf-8"))
+                     for timestamp, chunk in track.iter_chunks(0.2))
+    json_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = b"".join(encode_waveform(track.buffer, track.sample_rate, frame_duration=0.2))
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = np.concatenate([chunk for _, chunk in decode_stream(data)])
+    decode_time = time.perf_counter() - start
+
+    print(f"📳 {track.duration / 60:.0f} minute race at {track.sample_rate} Hz, 200 ms chunks")
+    print(f"JSON:   {json_bytes / 1e6:8.2f} MB, {json_bytes / track.duration / 1024:7.2f} KB/s of race, "
+          f"encoded in {json_time * 1000:.0f} ms")
+    print(f"Binary: {len(data) / 1e6:8.2f} MB, {len(data) / track.duration / 1024:7.2f} KB/s of race, "
+          f"encoded in {encode_time * 1000:.0f} ms, decoded in {decode_time * 1000:.0f} ms")
+    print(f"{json_bytes / len(data):.1f}x smaller, max amplitude error {np.abs(decoded - track.buffer).max():.4f}")
+
+
+if __name__ == "__main__":
+    main()
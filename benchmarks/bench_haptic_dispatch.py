@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Load test for the haptic dispatcher
+
+Connects 10k simulated devices (a tenth of them on slow links) to one
+HapticDispatcher, publishes race events faster than the per-device rate
+limit allows, and reports sends, coalesced and dropped frames and the
+publish-to-device latency histogram.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.haptic_dispatcher import HapticDispatcher, SimulatedDevice
+
+SLOW_FRACTION = 0.1
+SLOW_DELAY = 0.25
+
+
+async def run(device_count, events, interval):
+    """Publish the events to every device and return the dispatcher metrics"""
+    rng = random.Random(17)
+    devices = [SimulatedDevice(device_id, SLOW_DELAY if rng.random() < SLOW_FRACTION else 0.0)
+               for device_id in range(device_count)]
+    dispatcher = HapticDispatcher(devices, rate=10.0, burst=3)
+    await dispatcher.start()
+
+    for event_type, intensity, duration in events:
+        dispatcher.publish(event_type, intensity, duration)
+        await asyncio.sleep(interval)
+    await dispatcher.close()
+
+    return dispatcher.metrics(), sum(device.bytes_received for device in devices)
+
+
+def main():
+    """Run the load test"""
+    device_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rng = random.Random(3)
+    events = [(rng.choice(["overtake", "crash", "pit_stop", "safety_car", "finish"]), rng.uniform(0.4, 1.0),
+               rng.uniform(0.5, 2.0)) for _ in range(30)]
+
+    start = time.perf_counter()
+    metrics, received = asyncio.run(run(device_count, events, interval=0.05))
+    elapsed = time.perf_counter() - start
+
+    latency = metrics["latency"]
+    print(f"📳 {metrics['devices']} devices, {metrics['events_published']} events in {elapsed:.1f} s")
+    print(f"Sends: {metrics['sends']:,}, frames delivered: {metrics['frames_delivered']:,}, "
+          f"coalesced: {metrics['frames_coalesced']:,}, dropped: {metrics['frames_dropped']:,}, "
+          f"received {received / 1e6:.1f} MB")
+    print(f"Latency p50 {latency['p50'] * 1000:.0f} ms, p95 {latency['p95'] * 1000:.0f} ms, "
+          f"p99 {latency['p99'] * 1000:.0f} ms, max {latency['max'] * 1000:.0f} ms")
+    for bucket, count in latency["buckets"].items():
+        if count:
+            print(f"  {bucket:>9}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the precomputed haptic race track
+
+Renders a two hour race with thousands of overlapping events into one
+mixed track, then serves it as 200 ms device windows, reporting the
+render time and the cost per served chunk.
+"""
+
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.haptic_track import DEFAULT_PRIORITIES, HapticTrack
+
+
+def make_race_events(count, race_seconds=7200.0, seed=13):
+    """Random timestamped events, many of them overlapping"""
+    rng = random.Random(seed)
+    return [{
+        "timestamp": rng.uniform(0, race_seconds),
+        "event_type": rng.choice(list(DEFAULT_PRIORITIES)),
+        "intensity": rng.uniform(0.3, 1.0),
+        "duration": rng.uniform(0.5, 10.0)
+    } for _ in range(count)]
+
+
+def main():
+    """Run the benchmark"""
+    events = make_race_events(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
+
+    start = time.perf_counter()
+    track = HapticTrack(events)
+    render_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = sum(1 for _ in track.iter_chunks(0.2))
+    serve_time = time.perf_counter() - start
+
+    print(f"📳 {len(events)} events over {track.duration / 60:.0f} minutes at {track.sample_rate} Hz")
+    print(f"Rendered in {render_time * 1000:.1f} ms ({track.buffer.nbytes / 1e6:.1f} MB buffer)")
+    print(f"Served {chunks} 200 ms chunks in {serve_time * 1000:.1f} ms "
+          f"({serve_time / chunks * 1e6:.2f} µs per chunk)")
+
+
+if __name__ == "__main__":
+    main()
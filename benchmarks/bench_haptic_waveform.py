@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the haptic waveform engine
+
+Generates the sampled waveforms for a full race worth of haptic events
+(one event every few seconds over two hours) and reports the total time
+and samples per second.
+"""
+
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.haptic_simulator import HapticSimulator
+
+
+def make_race_events(count, seed=11):
+    """Random (event type, intensity, duration) tuples"""
+    rng = random.Random(seed)
+    event_types = ["overtake", "crash", "finish", "pit_stop", "safety_car"]
+    return [(rng.choice(event_types), rng.uniform(0.3, 1.0), rng.uniform(0.5, 30.0)) for _ in range(count)]
+
+
+def main():
+    """Run the benchmark"""
+    events = make_race_events(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
+    haptic = HapticSimulator(sample_rate=1000)
+
+    start = time.perf_counter()
+    samples = sum(len(haptic.generate_waveform(*event)) for event in events)
+    elapsed = time.perf_counter() - start
+
+    race_seconds = sum(duration for _, _, duration in events)
+    print(f"📳 {len(events)} events, {race_seconds / 60:.0f} minutes of vibration at {haptic.sample_rate} Hz")
+    print(f"Generated {samples:,} samples in {elapsed * 1000:.1f} ms ({samples / elapsed / 1e6:.1f} M samples/s)")
+
+
+if __name__ == "__main__":
+    main()
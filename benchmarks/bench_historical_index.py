@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the historical event search index
+
+Builds a synthetic 50k-event F1 history, indexes it and reports the build
+time and the per-query latency of top-k searches for live race events,
+against the 1 ms target. A linear scan that scores every event by shared
+terms is timed on the same queries for comparison.
+"""
+
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.historical_index import HistoricalEventIndex, tokenize
+
+TARGET_QUERY_SECONDS = 0.001
+
+DRIVERS = ["Ayrton Senna", "Alain Prost", "Michael Schumacher", "Lewis Hamilton", "Max Verstappen",
+           "Fernando Alonso", "Sebastian Vettel", "Niki Lauda", "Jim Clark", "Juan Manuel Fangio",
+           "Mika Hakkinen", "Nigel Mansell", "Kimi Raikkonen", "Charles Leclerc", "Jenson Button"]
+TEAMS = ["Ferrari", "McLaren", "Williams", "Red Bull Racing", "Mercedes", "Lotus", "Renault", "Brabham"]
+CIRCUITS = ["Monza", "Monaco", "Silverstone", "Spa", "Suzuka", "Interlagos", "Imola", "Hockenheim",
+            "Zandvoort", "Montreal", "Fuji", "Hungaroring", "Barcelona", "Melbourne", "Baku"]
+CORNERS = ["the first corner", "the hairpin", "Eau Rouge", "the chicane", "the last corner", "turn 3",
+           "the tunnel exit", "Copse", "130R", "Tamburello"]
+
+TEMPLATES = {
+    "crash": ("{adjective} crash at {corner} in {circuit}", ["Heavy", "Fatal", "Multi-car", "Wet weather"],
+              ["Led to safety improvements", "Red flag and race restart", "Ended the championship challenge"],
+              ["High-speed crash at a challenging corner", "Collision on the opening lap"]),
+    "overtake": ("{adjective} overtake at {corner} in {circuit}", ["Last lap", "Daring", "Around the outside"],
+                 ["Won the race", "Decided the championship", "Showcased new talent"],
+                 ["Aggressive overtaking move", "Championship-deciding overtake"]),
+    "pit_stop": ("{adjective} pit stop at {circuit}", ["Record", "Botched", "Double-stack"],
+                 ["Gained track position", "Lost the lead", "Fastest stop of the season"],
+                 ["Ultra-fast tire change", "Pit strategy gamble"]),
+    "safety_car": ("{adjective} safety car at {circuit}", ["Late", "Virtual", "Opening lap"],
+                   ["Bunched up the field", "Changed the strategy calls", "Neutralized the race"],
+                   ["Safety car deployment", "Race control intervention"]),
+    "weather": ("{adjective} rain at {circuit}", ["Torrential", "Sudden", "Drying"],
+                ["One of the most chaotic wet races", "Tire gamble paid off", "Race suspended"],
+                ["Weather affecting race outcome", "Wet track and changing grip"])
+}
+
+QUERIES = ["Alonso crashes at turn 3", "Verstappen overtakes Hamilton", "Safety car deployed",
+           "Pit stop strategy change", "Weather conditions worsen", "Heavy rain at Spa",
+           "Collision at the first corner in Monza", "Leclerc passes Sainz at the chicane",
+           "Red Bull Racing record pit stop", "Virtual safety car after a crash at Eau Rouge"]
+
+# Inflected and synonym queries with the event type their best match must have
+SANITY_QUERIES = [("Leclerc passes Sainz", "overtake"), ("Hamilton passing Vettel", "overtake"),
+                  ("Two cars collided at the hairpin", "crash"), ("Accidents at turn 3", "crash"),
+                  ("Tyres going off, Ferrari boxes", "pit_stop"), ("Heavy rain falling", "weather")]
+
+
+def generate_history(count, seed=5):
+    """Random historical events shaped like MemoryPalace.historical_database entries"""
+    rng = random.Random(seed)
+    event_types = list(TEMPLATES)
+    history = []
+    for _ in range(count):
+        event_type = rng.choice(event_types)
+        template, adjectives, impacts, similarities = TEMPLATES[event_type]
+        event = {
+            "year": rng.randint(1950, 2024),
+            "type": event_type,
+            "event": template.format(adjective=rng.choice(adjectives), corner=rng.choice(CORNERS),
+                                     circuit=rng.choice(CIRCUITS)),
+            "impact": rng.choice(impacts),
+            "similarity": rng.choice(similarities)
+        }
+        if event_type == "pit_stop":
+            event["team"] = rng.choice(TEAMS)
+        else:
+            event["driver"] = rng.choice(DRIVERS)
+        history.append(event)
+    return history
+
+
+def linear_scan(documents, query, k):
+    """Score every event by the number of query terms it shares"""
+    terms = set(tokenize(query))
+    scored = [(len(terms & document), event_id) for event_id, document in enumerate(documents)]
+    return sorted((item for item in scored if item[0]), key=lambda item: (-item[0], item[1]))[:k]
+
+
+def time_queries(search, rounds):
+    """Latency of every query over several rounds, sorted"""
+    latencies = []
+    for _ in range(rounds):
+        for query in QUERIES:
+            start = time.perf_counter()
+            search(query)
+            latencies.append(time.perf_counter() - start)
+    return sorted(latencies)
+
+
+def main():
+    """Run the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    k = 5
+    history = generate_history(count)
+
+    start = time.perf_counter()
+    index = HistoricalEventIndex(history)
+    build_time = time.perf_counter() - start
+    print(f"🏛️ Indexed {len(index):,} events ({index.vocabulary_size:,} terms) in {build_time:.2f} s")
+
+    latencies = time_queries(lambda query: index.search(query, k), rounds=50)
+    mean = sum(latencies) / len(latencies)
+    p99 = latencies[int(len(latencies) * 0.99)]
+
+    fields = ("type", "driver", "team", "event", "impact", "similarity")
+    documents = [set(tokenize(" ".join(str(event.get(field, "")) for field in fields))) for event in history]
+    scan = time_queries(lambda query: linear_scan(documents, query, k), rounds=1)
+    scan_mean = sum(scan) / len(scan)
+
+    status = "✅" if p99 < TARGET_QUERY_SECONDS else "❌"
+    print(f"{status} Top-{k} query: mean {mean * 1000:.3f} ms, p99 {p99 * 1000:.3f} ms "
+          f"(target {TARGET_QUERY_SECONDS * 1000:.0f} ms)")
+    print(f"Linear scan of every event: mean {scan_mean * 1000:.1f} ms ({scan_mean / mean:.0f}x slower)")
+
+    for query in QUERIES[:3]:
+        best, score = index.search(query, 1)[0]
+        print(f"  {query!r} -> {best['year']} {best['event']} ({score:.2f})")
+
+    for query, expected_type in SANITY_QUERIES:
+        matches = index.search(query, 1)
+        found_type = matches[0][0]["type"] if matches else None
+        status = "✅" if found_type == expected_type else "❌"
+        print(f"{status} {query!r} -> {found_type} (expected {expected_type})")
+
+
+if __name__ == "__main__":
+    main()
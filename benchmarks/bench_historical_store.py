@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the historical event store
+
+Compiles a synthetic 50k-event F1 history into an SQLite store and times
+indexed timeline, period and range queries such as "all 1990s crashes"
+against filtering and re-sorting the events in Python, the way the old
+hardcoded dict was used on every call.
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_historical_index import generate_history
+from utils.historical_store import build_historical_store, load_historical_source, open_historical_store
+
+
+def time_call(function, rounds):
+    """Mean seconds per call and the last result"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = function()
+    return (time.perf_counter() - start) / rounds, result
+
+
+def main():
+    """Run the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    history = generate_history(count)
+    periods = load_historical_source()["periods"]
+    by_type = {}
+    for event in history:
+        by_type.setdefault(event["type"], []).append(event)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "historical_events.db")
+        start = time.perf_counter()
+        build_historical_store({"events": history, "periods": periods}, path)
+        build_time = time.perf_counter() - start
+        # Keep the source path out of the way so the compiled file is used
+        store = open_historical_store(path, source_path=os.path.join(directory, "missing.json"))
+        print(f"🏛️ Compiled {len(store):,} events into SQLite in {build_time:.2f} s "
+              f"({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+        load_time, timeline = time_call(store.timeline, 1)
+        print(f"Loaded the timeline once in {load_time * 1000:.0f} ms")
+
+        cases = [
+            ("All 1990s crashes",
+             lambda: store.events_in_decade(1990, "crash"),
+             lambda: sorted((event for event in by_type["crash"] if 1990 <= event["year"] <= 1999),
+                            key=lambda event: event["year"])),
+            ("Ayrton Senna's events",
+             lambda: store.query(driver="Ayrton Senna"),
+             lambda: sorted((event for events in by_type.values() for event in events
+                             if event.get("driver") == "Ayrton Senna"), key=lambda event: event["year"])),
+            ("Ferrari pit stops since 2010",
+             lambda: store.query(event_type="pit_stop", team="Ferrari", start_year=2010),
+             lambda: sorted((event for event in by_type["pit_stop"]
+                             if event.get("team") == "Ferrari" and event["year"] >= 2010),
+                            key=lambda event: event["year"])),
+            ("1970s-1980s period",
+             lambda: store.period_events("1970s-1980s"),
+             lambda: sorted((event for events in by_type.values() for event in events
+                             if 1970 <= event["year"] <= 1989), key=lambda event: event["year"]))
+        ]
+        for name, indexed, scanned in cases:
+            indexed_time, rows = time_call(indexed, 20)
+            scan_time, expected = time_call(scanned, 20)
+            status = "✅" if len(rows) == len(expected) else "❌"
+            print(f"{status} {name}: {len(rows):,} events in {indexed_time * 1000:.2f} ms indexed, "
+                  f"{scan_time * 1000:.2f} ms by filtering every event")
+
+        cached_time, _ = time_call(store.timeline, 1000)
+        rebuild_time, _ = time_call(lambda: sorted((event for events in by_type.values() for event in events),
+                                                   key=lambda event: event["year"]), 5)
+        print(f"Timeline of {len(timeline):,} events: {cached_time * 1e6:.2f} µs per call "
+              f"(re-flattening and sorting: {rebuild_time * 1000:.1f} ms)")
+        print("Query plan for the 1990s crashes:", "; ".join(store.query_plan(event_type="crash", start_year=1990,
+                                                                             end_year=1999)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the sign language gloss engine
+
+Glosses commentary lines against a 10k-entry sign vocabulary (the real
+signs plus synthetic words and two-word phrases) and reports lines per
+second and average signs found per line.
+"""
+
+import os
+import random
+import string
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.sign_language import SignGlossEngine, SignLanguageAvatar
+
+
+def make_vocabulary(size, seed=5):
+    """Extend the real sign vocabulary with synthetic words and phrases"""
+    rng = random.Random(seed)
+    vocabulary = list(SignLanguageAvatar().sign_database)
+    vocabulary += ["leads", "gap", "seconds", "tires", "flag", "turn", "lap", "yellow flag", "red flag",
+                   "fastest lap", "closing the gap"]
+    vocabulary = dict.fromkeys(vocabulary)
+    while len(vocabulary) < size:
+        words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+                 for _ in range(rng.randint(1, 2))]
+        vocabulary[" ".join(words)] = None
+    return list(vocabulary)
+
+
+def main():
+    """Run the benchmark"""
+    vocabulary = make_vocabulary(10000)
+    lines = generate_commentary(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
+
+    start = time.perf_counter()
+    engine = SignGlossEngine(vocabulary)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    signs = sum(len(engine.gloss(line)) for line in lines)
+    elapsed = time.perf_counter() - start
+
+    known = set(vocabulary)
+    split_signs = sum(sum(1 for word in line.lower().split() if word in known) for line in lines)
+
+    print(f"🤟 {len(vocabulary)} signs, engine built in {build_time * 1000:.1f} ms")
+    print(f"Glossed {len(lines)} lines at {len(lines) / elapsed:,.0f} lines/s "
+          f"({elapsed / len(lines) * 1e6:.1f} µs per line)")
+    print(f"Signs per line: {signs / len(lines):.2f} (plain split lookup found {split_signs / len(lines):.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Simulated live feed for the sign language stream
+
+Publishes commentary at increasing rates into a SignLanguageStream with
+time scaled down (short signs, short latency budget) and reports how
+many events were signed, compressed and dropped, the peak queue depth
+and the end-to-end latency. At overload the latency should stay close to
+the budget instead of growing with the backlog.
+"""
+
+import asyncio
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.sign_stream import SignLanguageStream, simulate_commentary_feed
+
+SIGN_DURATION = 0.01
+LATENCY_BUDGET = 0.1
+
+
+async def run_feed(lines, interval):
+    """Stream the lines at one publishing interval and return the metrics"""
+    stream = SignLanguageStream(latency_budget=LATENCY_BUDGET, sign_duration=SIGN_DURATION,
+                                clock=time.monotonic)
+    consumer = asyncio.create_task(stream.run())
+    await simulate_commentary_feed(stream, lines, interval)
+    await consumer
+    return stream.metrics()
+
+
+def main():
+    """Run the simulation"""
+    lines = generate_commentary(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
+
+    print(f"🤟 {len(lines)} events, {SIGN_DURATION * 1000:.0f} ms per sign, "
+          f"{LATENCY_BUDGET * 1000:.0f} ms latency budget")
+    for interval in (0.05, 0.02, 0.01, 0.005):
+        metrics = asyncio.run(run_feed(lines, interval))
+        print(f"Every {interval * 1000:4.0f} ms: {metrics['emitted']:4d} signed, "
+              f"{metrics['compressed']:4d} compressed, {metrics['dropped']:4d} dropped, {metrics['empty']:3d} empty, "
+              f"max queue {metrics['max_queue_depth']:3d}, "
+              f"latency p50 {metrics['latency_p50'] * 1000:6.1f} ms, "
+              f"p95 {metrics['latency_p95'] * 1000:6.1f} ms, max {metrics['latency_max'] * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
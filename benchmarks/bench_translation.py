@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for translate_text_comprehensive
+
+Compares a verbatim copy of the previous translate_text_comprehensive,
+which rebuilt the dictionaries and phrase tables on every call, with the
+shared TranslationEngine that builds them once. The engine is timed with
+its result cache disabled as well as through translate_text_comprehensive,
+since the synthetic feed repeats many lines.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.translation import TranslationEngine, get_comprehensive_translation_dict, translate_text_comprehensive
+
+LANGUAGES = ["Spanish", "French", "Simplified"]
+
+
+def translate_before(text, target_language):
+    """translate_text_comprehensive as it was before the shared engine, copied verbatim"""
+    import random
+
+    # Get comprehensive translation dictionary
+    f1_patterns = get_comprehensive_translation_dict()
+
+    if target_language == "Simplified":
+        # Simplify the text
+        simplified = text
+        # Replace complex terms with simpler ones
+        replacements = {
+            "LAP": "Lap",
+            "leads by": "is first",
+            "closing the gap": "chasing",
+            "pits for": "stops for",
+            "fresh tires": "new tires",
+            "enters the pits": "stops",
+            "overtakes": "passes",
+            "championship": "title",
+            "qualifying": "qualifying",
+            "grid position": "starting position",
+            "fastest lap": "best lap",
+            "safety car": "safety car",
+            "red flag": "red flag",
+            "yellow flag": "yellow flag",
+            "blue flag": "blue flag"
+        }
+
+        for complex_term, simple_term in replacements.items():
+            simplified = simplified.replace(complex_term, simple_term)
+
+        return simplified
+
+    # Get translation patterns for the target language
+    patterns = f1_patterns.get(target_language, {})
+
+    # Enhanced translation with phrase patterns
+    phrase_patterns = {
+        "Spanish": {
+            "leads by": "lidera por",
+            "closing the gap": "cerrando la brecha",
+            "pits for": "entra a boxes por",
+            "fresh tires": "neumáticos nuevos",
+            "enters the pits": "entra a boxes",
+            "overtakes": "adelanta a",
+            "at turn": "en la curva",
+            "due to": "debido a",
+            "safety car": "coche de seguridad",
+            "red flag": "bandera roja",
+            "yellow flag": "bandera amarilla"
+        },
+        "French": {
+            "leads by": "mène de",
+            "closing the gap": "réduit l'écart",
+            "pits for": "s'arrête pour",
+            "fresh tires": "nouveaux pneus",
+            "enters the pits": "entre aux stands",
+            "overtakes": "dépasse",
+            "at turn": "au virage",
+            "due to": "à cause de",
+            "safety car": "voiture de sécurité",
+            "red flag": "drapeau rouge",
+            "yellow flag": "drapeau jaune"
+        }
+    }
+
+    # First, translate phrases
+    translated_text = text
+    phrases = phrase_patterns.get(target_language, {})
+
+    for english_phrase, translated_phrase in phrases.items():
+        translated_text = translated_text.replace(english_phrase, translated_phrase)
+
+    # Then translate individual words
+    words = translated_text.split()
+    translated_words = []
+
+    for word in words:
+        # Clean word (remove punctuation for lookup)
+        clean_word = word.strip(".,!?;:")
+        if clean_word.upper() in patterns:
+            translated_word = patterns[clean_word.upper()]
+            # Preserve original case and punctuation
+            if word.isupper():
+                translated_words.append(translated_word.upper())
+            elif word.istitle():
+                translated_words.append(translated_word.title())
+            else:
+                translated_words.append(translated_word.lower())
+        else:
+            translated_words.append(word)
+
+    return " ".join(translated_words)
+
+
+def measure(translate, lines, target_language):
+    """Return lines per second for a translation function"""
+    start = time.perf_counter()
+    for line in lines:
+        translate(line, target_language)
+    return len(lines) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the before/after comparison"""
+    lines = generate_commentary(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+
+    uncached = TranslationEngine(cache_size=0)
+
+    print(f"🏎️ Translating {len(lines)} commentary lines (lines/s)")
+    print(f"{'Language':<12}{'Before':>12}{'Uncached':>12}{'Speedup':>10}{'Cached':>12}{'Speedup':>10}")
+    for language in LANGUAGES:
+        before = measure(translate_before, lines, language)
+        after_uncached = measure(uncached.translate, lines, language)
+        after = measure(translate_text_comprehensive, lines, language)
+        print(f"{language:<12}{before:>12,.0f}{after_uncached:>12,.0f}{after_uncached / before:>9.1f}x"
+              f"{after:>12,.0f}{after / before:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
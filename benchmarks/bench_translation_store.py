@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the compiled, memory-mapped translation store
+
+Builds synthetic full-vocabulary glossaries, then compares constructing
+them as in-memory dictionaries with opening the compiled store, and the
+lookup speed of both.
+"""
+
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.translation_store import TranslationStore, build_translation_store
+
+
+def make_glossaries(languages, entries, seed=11):
+    """Generate random glossaries with upper case keys"""
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(3, 12))) for _ in range(entries)]
+    return {f"Language{i}": {word: word.lower()[::-1] for word in words} for i in range(languages)}
+
+
+def main():
+    """Run the benchmark"""
+    languages, entries = 20, 50000
+    glossaries = make_glossaries(languages, entries)
+    lookups = random.Random(3).sample(list(glossaries["Language0"]), 20000)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "translations.bin")
+        start = time.perf_counter()
+        build_translation_store(glossaries, path)
+        print(f"🏗️  Built {languages} x {entries} entries in {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(path) / 1e6:.1f} MB)")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        in_memory = {language: dict(glossary) for language, glossary in glossaries.items()}
+        dict_time = time.perf_counter() - start
+        dict_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        store = TranslationStore(path)
+        compiled = {language: store.get_dictionary(language) for language in store.languages()}
+        store_time = time.perf_counter() - start
+        store_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        print(f"Load  dicts {dict_time * 1000:8.1f} ms {dict_memory / 1e6:8.1f} MB private")
+        print(f"Load  store {store_time * 1000:8.1f} ms {store_memory / 1e6:8.1f} MB private")
+
+        for name, dictionary in (("dicts", in_memory["Language0"]), ("store", compiled["Language0"])):
+            start = time.perf_counter()
+            for word in lookups:
+                dictionary.get(word)
+            elapsed = time.perf_counter() - start
+            print(f"Lookup {name} {len(lookups) / elapsed:>12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    main()
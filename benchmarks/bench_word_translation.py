@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Equivalence check and benchmark for the word translation tokenizer
+
+Generates random commentary-like corpora and checks that WordTranslator
+matches the previous split/strip/lookup loop on every line, except that
+punctuation around translated words is now kept. Then compares speed.
+"""
+
+import os
+import random
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.translation import WORD_PUNCTUATION, WordTranslator, get_comprehensive_translation_dict
+
+LANGUAGES = ["Spanish", "French"]
+ALPHABET = ["LAP", "lap", "Lap", "lAp", "laps", "10", "Max", "leads", "P2", "'", "-", "é", "ß"]
+
+
+def reference_translate(text, translations):
+    """Previous word loop, with stripped punctuation put back on translated words"""
+    translated_words = []
+    for word in text.split():
+        clean_word = word.strip(WORD_PUNCTUATION)
+        if clean_word.upper() in translations:
+            translated_word = translations[clean_word.upper()]
+            if word.isupper():
+                translated_word = translated_word.upper()
+            elif word.istitle():
+                translated_word = translated_word.title()
+            else:
+                translated_word = translated_word.lower()
+            start = word.index(clean_word) if clean_word else len(word)
+            translated_words.append(word[:start] + translated_word + word[start + len(clean_word):])
+        else:
+            translated_words.append(word)
+    return " ".join(translated_words)
+
+
+def random_line(rng):
+    """Build a random line from words, punctuation and whitespace"""
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        token = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 2)))
+        leading = "".join(rng.choice(WORD_PUNCTUATION) for _ in range(rng.randint(0, 2)))
+        trailing = "".join(rng.choice(WORD_PUNCTUATION) for _ in range(rng.randint(0, 2)))
+        parts.append(leading + token + trailing)
+    return " ".join(parts)
+
+
+def check_equivalence(dictionaries, samples=50000, seed=7):
+    """Check the tokenizer against the reference loop on a generated corpus"""
+    rng = random.Random(seed)
+    corpus = [random_line(rng) for _ in range(samples)] + generate_commentary(samples, seed)
+    for language in LANGUAGES:
+        translator = WordTranslator(dictionaries[language])
+        for line in corpus:
+            expected = reference_translate(line, dictionaries[language])
+            actual = translator.translate(" ".join(line.split()))
+            assert actual == expected, f"{language}: {line!r} -> {actual!r}, expected {expected!r}"
+    print(f"✅ {len(corpus) * len(LANGUAGES)} generated lines match the reference word loop")
+
+
+def main():
+    """Run the equivalence check and the benchmark"""
+    dictionaries = get_comprehensive_translation_dict()
+    check_equivalence(dictionaries)
+
+    lines = [" ".join(line.split()) for line in generate_commentary(50000)]
+    for language in LANGUAGES:
+        start = time.perf_counter()
+        for line in lines:
+            reference_translate(line, dictionaries[language])
+        before = time.perf_counter() - start
+
+        translator = WordTranslator(dictionaries[language])
+        start = time.perf_counter()
+        for line in lines:
+            translator.translate(line)
+        after = time.perf_counter() - start
+
+        print(f"{language:<10} word loop {len(lines) / before:>10,.0f} lines/s   "
+              f"tokenizer {len(lines) / after:>10,.0f} lines/s   ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Synthetic race commentary used by the benchmark scripts.
+"""
+
+import random
+from typing import List
+
+DRIVERS = ["Max Verstappen", "Lewis Hamilton", "Fernando Alonso", "Charles Leclerc",
+           "Lando Norris", "George Russell", "Carlos Sainz", "Oscar Piastri"]
+
+TEMPLATES = [
+    "LAP {lap}: {driver} leads by {gap} seconds",
+    "{driver} enters the pits for fresh tires",
+    "{driver} overtakes {other} at turn {turn}!",
+    "{driver} is closing the gap to {other}, now {gap} seconds behind",
+    "Safety car deployed due to debris at turn {turn}",
+    "LAP {lap}: {driver} in P1, {other} in P2",
+    "Yellow flag in sector {sector}, {driver} has to slow down",
+    "{driver} sets the fastest lap of the race",
+    "Red flag! The race is stopped after a crash at turn {turn}",
+    "{driver} pits for hard tires and rejoins in P{position}",
+]
+
+
+def generate_commentary(count: int, seed: int = 2025) -> List[str]:
+    """Generate a reproducible list of commentary lines"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        driver, other = rng.sample(DRIVERS, 2)
+        lines.append(rng.choice(TEMPLATES).format(
+            lap=1 + i % 58,
+            driver=driver,
+            other=other,
+            gap=f"{rng.uniform(0.1, 9.9):.1f}",
+            turn=rng.randint(1, 18),
+            sector=rng.randint(1, 3),
+            position=rng.randint(1, 20),
+        ))
+    return lines
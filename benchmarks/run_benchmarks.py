@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Commentary throughput benchmark suite with regression gates
+
+Runs each commentary benchmark on synthetic corpora, recording ops/sec
+and peak traced memory, and compares the results with the stored
+baseline in benchmarks/baseline.json. A benchmark fails when its
+throughput drops, or its peak memory grows, by more than the threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # compare with the baseline
+    python benchmarks/run_benchmarks.py --save-baseline  # record a new baseline
+    python benchmarks/run_benchmarks.py --sizes 1000 --threshold 0.3
+
+Baselines are machine specific, so record one on the machine that runs
+the gate.
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.commentary_corpus import generate_commentary
+from utils.multilingual_commentary import MultilingualCommentary
+from utils.translation import get_translation_engine, translate_text_comprehensive
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = [1000, 100000]
+# Absolute allowance so tiny peaks do not fail on allocator noise
+MEMORY_SLACK_BYTES = 64 * 1024
+QUICK_PHRASES = ["Safety car deployed", "Driver in the lead", "Pit stop required", "Race finished",
+                 "Yellow flag in sector 2"]
+
+
+def clear_caches():
+    """Start every benchmark from empty translation caches"""
+    get_translation_engine().cache.clear()
+    MultilingualCommentary().clear_cache()
+
+
+def make_benchmarks():
+    """Build the benchmark functions, each taking a list of commentary lines"""
+    commentary = MultilingualCommentary()
+    languages = ["Spanish", "French", "Simplified"]
+
+    def translate_comprehensive(lines):
+        for index, line in enumerate(lines):
+            translate_text_comprehensive(line, languages[index % len(languages)])
+
+    def translate_and_simplify(lines):
+        for index, line in enumerate(lines):
+            commentary.translate_and_simplify(line, languages[index % len(languages)])
+
+    def generate_summary(lines):
+        for line in lines:
+            commentary.generate_summary(line)
+
+    def quick_translate(lines):
+        for index in range(len(lines)):
+            commentary.quick_translate(QUICK_PHRASES[index % len(QUICK_PHRASES)], languages[index % len(languages)])
+
+    return {
+        "translate_text_comprehensive": translate_comprehensive,
+        "translate_and_simplify": translate_and_simplify,
+        "generate_summary": generate_summary,
+        "quick_translate": quick_translate,
+    }
+
+
+def measure(benchmark, lines, repeat):
+    """Measure the best ops/sec over several runs and the peak traced memory"""
+    ops_per_sec = 0
+    for _ in range(repeat):
+        clear_caches()
+        gc.collect()
+        start = time.perf_counter()
+        benchmark(lines)
+        ops_per_sec = max(ops_per_sec, len(lines) / (time.perf_counter() - start))
+
+    # Memory is measured in a separate run, tracemalloc slows execution down
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    benchmark(lines)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"ops_per_sec": ops_per_sec, "peak_memory_bytes": peak_memory}
+
+
+def run(sizes, repeat):
+    """Run every benchmark on every corpus size"""
+    results = {}
+    benchmarks = make_benchmarks()
+    for size in sizes:
+        lines = generate_commentary(size)
+        for name, benchmark in benchmarks.items():
+            key = f"{name}[{size}]"
+            results[key] = measure(benchmark, lines, repeat)
+            print(f"{key:<40}{results[key]['ops_per_sec']:>14,.0f} ops/s"
+                  f"{results[key]['peak_memory_bytes'] / 1e6:>10.2f} MB peak")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Compare results with the baseline, returning the list of regressions"""
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline:
+            print(f"⚠️  {key}: no baseline recorded")
+            continue
+
+        expected = baseline[key]
+        if result["ops_per_sec"] < expected["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{key}: {result['ops_per_sec']:,.0f} ops/s, "
+                               f"baseline {expected['ops_per_sec']:,.0f} ops/s")
+        if result["peak_memory_bytes"] > expected["peak_memory_bytes"] * (1 + threshold) + MEMORY_SLACK_BYTES:
+            regressions.append(f"{key}: {result['peak_memory_bytes'] / 1e6:.2f} MB peak, "
+                               f"baseline {expected['peak_memory_bytes'] / 1e6:.2f} MB")
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run the commentary benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Corpus sizes in lines")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per benchmark, best is kept")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed relative regression")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="Record the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    print("🏎️ Commentary benchmark suite")
+    results = run(args.sizes, args.repeat)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n✅ Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️  No baseline at {args.baseline}, run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ from streamlit_option_menu import option_menu
 import os
 from pages.inclusive_companion import show_inclusive_companion
 from pages.fan_engagement import show_fan_engagement
+from utils.emotion_detection import get_emotion_inference_pool
 
 # Page configuration
 st.set_page_config(
@@ -12,6 +13,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Start loading and warming up the emotion model in the background, so the first mirror click is fast
+get_emotion_inference_pool()
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -1,5 +1,6 @@
 import streamlit as st
 import cv2
+import hashlib
 import numpy as np
 from PIL import Image
 import requests
@@ -7,7 +8,7 @@ import json
 import time
 import random
 from utils.sign_language import SignLanguageAvatar
-from utils.emotion_detection import EmotionDetector
+from utils.emotion_detection import EmotionDetector, FrameIngestor, get_emotion_inference_pool
 from utils.haptic_simulator import HapticSimulator
 from utils.memory_palace import MemoryPalace
 from utils.multilingual_commentary import MultilingualCommentary
@@ -117,21 +118,21 @@ def show_haptic_vibrations():
         
         if st.button("Trigger Haptic Event", key="haptic_btn"):
             haptic = HapticSimulator()
-            haptic.trigger_event(event_type, intensity, duration)
+            event = haptic.trigger_event(event_type.replace(" ", "_"), intensity, duration)
             
             # Visual feedback
             st.success(f"Triggered {event_type} vibration!")
             
             # Show vibration pattern
             st.subheader("Vibration Pattern")
-            pattern = haptic.get_pattern(event_type)
+            waveform = event["waveform"]
             
             # Create a simple visualization
             import matplotlib.pyplot as plt
             fig, ax = plt.subplots(figsize=(10, 3))
-            ax.plot(pattern)
+            ax.plot(np.arange(len(waveform)) / event["sample_rate"], waveform)
             ax.set_title(f"{event_type} Vibration Pattern")
-            ax.set_xlabel("Time")
+            ax.set_xlabel("Time (s)")
             ax.set_ylabel("Intensity")
             st.pyplot(fig)
     
@@ -161,18 +162,40 @@ def show_emotional_mirror():
     st.header("😊 Emotional Mirror")
     st.markdown("Ai.lonso reflects your emotions in real-time during the race!")
     
+    # One detector per browser session, all sharing the process-wide model and inference workers
+    if "emotion_detector" not in st.session_state:
+        st.session_state.emotion_detector = EmotionDetector(pool=get_emotion_inference_pool())
+        st.session_state.frame_ingestor = FrameIngestor()
+    detector = st.session_state.emotion_detector
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.subheader("Live Emotion Detection")
         
+        # Camera snapshot, decoded straight into the session's reusable frame buffer
+        snapshot = st.camera_input("Show Ai.lonso how you feel")
+        if snapshot is not None:
+            data = snapshot.getvalue()
+            digest = hashlib.sha1(data).hexdigest()
+            # camera_input keeps its value across reruns, so only detect on a new snapshot
+            last_snapshot = st.session_state.get("last_snapshot")
+            if last_snapshot is None or last_snapshot[0] != digest:
+                frame = st.session_state.frame_ingestor.from_bytes(data)
+                result = detector.detect_emotion_from_image(frame) if frame is not None else None
+                last_snapshot = st.session_state.last_snapshot = (digest, result)
+            
+            if last_snapshot[1] is None:
+                st.error("Could not read the camera image")
+            else:
+                emotion, intensity = last_snapshot[1]
+                st.write(f"{detector.get_ai_lonso_response(emotion)} (**{emotion}**, {intensity:.0%})")
+        
         # Camera input
         if st.button("Start Camera", key="camera_btn"):
             st.info("Camera started! Looking for emotions...")
             
             # Simulate emotion detection
-            detector = EmotionDetector()
-            
             # Create a placeholder for camera feed
             camera_placeholder = st.empty()
             
@@ -210,15 +233,12 @@ def show_emotional_mirror():
         
         # Show emotion timeline
         st.markdown("### Recent Emotions")
-        emotions_data = [
-            {"time": "14:32:15", "emotion": "Excited", "intensity": 8},
-            {"time": "14:31:45", "emotion": "Worried", "intensity": 6},
-            {"time": "14:31:20", "emotion": "Happy", "intensity": 9},
-            {"time": "14:30:55", "emotion": "Neutral", "intensity": 4},
-        ]
+        emotions_data = list(reversed(detector.get_emotion_history(limit=4)))
+        if not emotions_data:
+            st.info("No emotions detected yet")
         
         for data in emotions_data:
-            st.write(f"**{data['time']}** - {data['emotion']} ({data['intensity']}/10)")
+            st.write(f"**{data['timestamp']}** - {data['emotion'].title()} ({round(data['intensity'] * 10)}/10)")
 
 def show_memory_palace():
     st.header("🏛️ Memory Palace")
@@ -254,6 +274,12 @@ def show_memory_palace():
             st.write(f"**Driver:** {historical_data['driver']}")
             st.write(f"**Impact:** {historical_data['impact']}")
             
+            similar_moments = memory_palace.find_similar_events(selected_event, k=3)[1:]
+            if similar_moments:
+                st.markdown("**Other similar moments:**")
+                for moment in similar_moments:
+                    st.write(f"- {moment['year']}: {moment['event']}")
+            
             # Show historical video/image
             try:
                 st.image(f"assets/historical_{historical_data['year']}.jpg", 
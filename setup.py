@@ -38,6 +38,24 @@ def install_dependencies():
         print(f"❌ Failed to install dependencies: {e}")
         return False
 
+def build_translation_store():
+    """Compile the translation dictionaries into the memory-mapped store"""
+    try:
+        subprocess.check_call([sys.executable, "-m", "utils.translation_store", "build"])
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to compile translation dictionaries: {e}")
+        return False
+
+def build_historical_store():
+    """Compile the historical events into the indexed SQLite store"""
+    try:
+        subprocess.check_call([sys.executable, "-m", "utils.historical_store", "build"])
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to compile historical events: {e}")
+        return False
+
 def check_streamlit():
     """Check if Streamlit is properly installed"""
     try:
@@ -63,6 +81,16 @@ def main():
         print("Please install dependencies manually: pip install -r requirements.txt")
         return False
     
+    # Compile translation dictionaries
+    print("\n🌍 Compiling translation dictionaries...")
+    if not build_translation_store():
+        print("Translations will fall back to the built-in dictionaries")
+    
+    # Compile historical events
+    print("\n🏛️ Compiling historical events...")
+    if not build_historical_store():
+        print("The Memory Palace will load assets/historical_events.json at startup")
+    
     # Check Streamlit
     print("\n🔍 Checking installation...")
     if not check_streamlit():
@@ -0,0 +1,205 @@
+"""
+Streaming commentary pipeline over JSONL race feeds.
+
+Each input line is a JSON object with the commentary under a text field
+(or a bare JSON string). Every event is translated, simplified and
+summarized, then written out as one JSON line. The stages are chained
+generators, so only one event is in flight at a time and reading only
+advances as fast as output is written.
+
+For bulk reprocessing of race archives, --workers shards the input into
+chunks that are translated in a process pool. Each worker builds its
+translation tables once at startup, and output keeps the input order.
+
+Usage:
+    python -m utils.commentary_stream race.jsonl -o translated.jsonl --languages Spanish French
+    python -m utils.commentary_stream archive.jsonl -o archive_de.jsonl --workers 8
+"""
+
+import argparse
+import json
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
+
+from utils.multilingual_commentary import MultilingualCommentary
+from utils.translation import translate_text_comprehensive
+
+DEFAULT_LANGUAGES = ["Spanish", "French"]
+
+
+def read_events(stream: Iterable[str], text_field: str = "text", first_line: int = 1) -> Iterator[Dict]:
+    """Read commentary events from a JSONL stream line by line"""
+    for line_number, line in enumerate(stream, start=first_line):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"line": line_number, "error": f"Invalid JSON: {e}"}
+            continue
+
+        if isinstance(event, str):
+            event = {text_field: event}
+        if not isinstance(event, dict) or not isinstance(event.get(text_field), str):
+            yield {"line": line_number, "error": f"Missing '{text_field}' field"}
+            continue
+
+        yield event
+
+
+def process_events(events: Iterable[Dict], languages: List[str], text_field: str = "text") -> Iterator[Dict]:
+    """Translate, simplify and summarize each commentary event"""
+    commentary = MultilingualCommentary()
+
+    for event in events:
+        if "error" in event:
+            yield event
+            continue
+
+        text = event[text_field]
+        yield {
+            **event,
+            "translations": {
+                language: translate_text_comprehensive(text, language) for language in languages
+            },
+            "simplified": commentary.translate_and_simplify(text, "Simplified")["simplified"],
+            "summary": commentary.generate_summary(text)
+        }
+
+
+def write_events(records: Iterable[Dict], stream: TextIO, flush_every: int = 100) -> int:
+    """Write records as JSONL, returning how many were written"""
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        count += 1
+        if count % flush_every == 0:
+            stream.flush()
+
+    stream.flush()
+    return count
+
+
+def translate_jsonl(input_stream: TextIO, output_stream: TextIO, languages: List[str],
+                    text_field: str = "text") -> int:
+    """Run the full pipeline from an input JSONL stream to an output JSONL stream"""
+    events = read_events(input_stream, text_field)
+    return write_events(process_events(events, languages, text_field), output_stream)
+
+
+# Per-process state set up by the pool initializer
+_worker_options = {}
+
+
+def _init_worker(languages: List[str], text_field: str):
+    """Build the translation tables once per worker process"""
+    _worker_options["languages"] = languages
+    _worker_options["text_field"] = text_field
+    for language in languages:
+        translate_text_comprehensive("", language)
+
+
+def _process_chunk(chunk: Tuple[int, List[str]]) -> List[str]:
+    """Translate a chunk of raw JSONL lines inside a worker process"""
+    first_line, lines = chunk
+    languages = _worker_options["languages"]
+    text_field = _worker_options["text_field"]
+
+    events = read_events(lines, text_field, first_line)
+    return [json.dumps(record, ensure_ascii=False) + "\n"
+            for record in process_events(events, languages, text_field)]
+
+
+def _read_chunks(stream: TextIO, chunk_size: int) -> Iterator[Tuple[int, List[str]]]:
+    """Split a stream into chunks of raw lines tagged with their first line number"""
+    first_line = 1
+    while True:
+        lines = list(islice(stream, chunk_size))
+        if not lines:
+            return
+        yield first_line, lines
+        first_line += len(lines)
+
+
+def translate_jsonl_parallel(input_stream: TextIO, output_stream: TextIO, languages: List[str],
+                             text_field: str = "text", workers: int = 4, chunk_size: int = 1000) -> int:
+    """Run the pipeline across a process pool, writing output in input order"""
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("workers and chunk_size must be positive")
+
+    count = 0
+    # Cap the chunks in flight so memory stays bounded on huge archives
+    max_pending = workers * 2
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(languages, text_field)) as pool:
+        pending = deque()
+        for chunk in _read_chunks(input_stream, chunk_size):
+            pending.append(pool.submit(_process_chunk, chunk))
+            if len(pending) >= max_pending:
+                count += _write_chunk(pending.popleft().result(), output_stream)
+
+        while pending:
+            count += _write_chunk(pending.popleft().result(), output_stream)
+
+    output_stream.flush()
+    return count
+
+
+def _write_chunk(lines: List[str], stream: TextIO) -> int:
+    """Write a translated chunk, returning how many records it held"""
+    stream.writelines(lines)
+    return len(lines)
+
+
+def positive_int(value: str) -> int:
+    """Argument type for options that need a whole number of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Translate a JSONL race commentary feed")
+    parser.add_argument("input", help="Input JSONL file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Output JSONL file, or - for stdout")
+    parser.add_argument("--languages", nargs="+", default=DEFAULT_LANGUAGES, help="Target languages")
+    parser.add_argument("--text-field", default="text", help="Field holding the commentary text")
+    parser.add_argument("--workers", type=positive_int, default=1, help="Worker processes for bulk translation")
+    parser.add_argument("--chunk-size", type=positive_int, default=1000, help="Lines per worker task")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    input_stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output_stream = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        if args.workers > 1:
+            count = translate_jsonl_parallel(input_stream, output_stream, args.languages, args.text_field,
+                                             args.workers, args.chunk_size)
+        else:
+            count = translate_jsonl(input_stream, output_stream, args.languages, args.text_field)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+    print(f"✅ Processed {count} commentary events", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Crowd mood aggregation across many viewers.
+
+Viewers' emotion detections arrive as (emotion, intensity, timestamp)
+samples. They are added into a ring of fixed time buckets covering the
+sliding window, and running totals over the whole window are kept up to
+date as buckets close and expire. Memory is fixed by the window and
+bucket size however many samples arrive, and "crowd mood over the last
+30 seconds" is read from the running totals in constant time.
+"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_EMOTIONS = ["happy", "excited", "worried", "neutral", "surprised", "stressed"]
+
+
+class CrowdMoodAggregator:
+    """Sliding-window counts and mean intensities per emotion for a whole crowd"""
+
+    def __init__(self, emotions: List[str] = None, window: float = 30.0, bucket_size: float = 1.0,
+                 clock: Callable[[], float] = time.time):
+        self.emotions = list(emotions or DEFAULT_EMOTIONS)
+        self.emotion_ids = {emotion: index for index, emotion in enumerate(self.emotions)}
+        self.window = window
+        self.bucket_size = bucket_size
+        self.clock = clock
+
+        self._bucket_count = max(1, int(math.ceil(window / bucket_size)))
+        emotion_count = len(self.emotions)
+        self._counts = [[0] * emotion_count for _ in range(self._bucket_count)]
+        self._sums = [[0.0] * emotion_count for _ in range(self._bucket_count)]
+        self._total_counts = [0] * emotion_count
+        self._total_sums = [0.0] * emotion_count
+        # Absolute number of the newest bucket, buckets older than the ring are expired
+        self._newest = None
+        self._lock = threading.Lock()
+        self.ingested = 0
+        self.rejected = 0
+
+    def ingest(self, emotion: str, intensity: float, timestamp: float = None):
+        """Add one viewer sample"""
+        with self._lock:
+            self._add(emotion, intensity, self.clock() if timestamp is None else timestamp)
+
+    def ingest_many(self, samples: Iterable[Tuple[str, float, float]]) -> int:
+        """Add a batch of (emotion, intensity, timestamp) samples under one lock"""
+        with self._lock:
+            added = self.ingested
+            emotion_ids = self.emotion_ids
+            bucket_size = self.bucket_size
+            newest = self._newest
+            counts = sums = None
+            if newest is not None:
+                counts, sums = self._counts[newest % self._bucket_count], self._sums[newest % self._bucket_count]
+
+            fast = 0
+            for emotion, intensity, timestamp in samples:
+                emotion_id = emotion_ids.get(emotion)
+                # Fast path: most samples land in the current bucket
+                if emotion_id is not None and newest is not None and int(timestamp // bucket_size) == newest:
+                    counts[emotion_id] += 1
+                    sums[emotion_id] += intensity
+                    fast += 1
+                    continue
+
+                self._add(emotion, intensity, timestamp)
+                newest = self._newest
+                if newest is not None:
+                    counts, sums = self._counts[newest % self._bucket_count], self._sums[newest % self._bucket_count]
+
+            self.ingested += fast
+            return self.ingested - added
+
+    def _add(self, emotion: str, intensity: float, timestamp: float):
+        """Add a sample to its bucket, and to the window totals if the bucket is already closed"""
+        emotion_id = self.emotion_ids.get(emotion)
+        bucket = int(timestamp // self.bucket_size)
+        if emotion_id is None or (self._newest is not None and bucket <= self._newest - self._bucket_count):
+            # Unknown emotion, or too late to fall inside the window
+            self.rejected += 1
+            return
+
+        if self._newest is None or bucket > self._newest:
+            self._advance(bucket)
+
+        slot = bucket % self._bucket_count
+        self._counts[slot][emotion_id] += 1
+        self._sums[slot][emotion_id] += intensity
+        if bucket != self._newest:
+            # A late sample for a closed bucket that is still in the window
+            self._total_counts[emotion_id] += 1
+            self._total_sums[emotion_id] += intensity
+        self.ingested += 1
+
+    def _advance(self, bucket: int):
+        """Close the current bucket and expire the ones that fall out of the window"""
+        if self._newest is not None:
+            # The totals cover closed buckets, the current one is added at query time
+            slot = self._newest % self._bucket_count
+            for emotion_id, count in enumerate(self._counts[slot]):
+                self._total_counts[emotion_id] += count
+                self._total_sums[emotion_id] += self._sums[slot][emotion_id]
+
+            # At most one full turn of the ring needs clearing, however far time jumped
+            for expired in range(max(self._newest + 1, bucket - self._bucket_count + 1), bucket + 1):
+                slot = expired % self._bucket_count
+                counts, sums = self._counts[slot], self._sums[slot]
+                for emotion_id, count in enumerate(counts):
+                    if count:
+                        self._total_counts[emotion_id] -= count
+                        self._total_sums[emotion_id] -= sums[emotion_id]
+                        counts[emotion_id] = 0
+                        sums[emotion_id] = 0.0
+        self._newest = bucket
+
+    def mood(self, now: float = None) -> Dict:
+        """Crowd mood over the sliding window ending now"""
+        with self._lock:
+            bucket = int((self.clock() if now is None else now) // self.bucket_size)
+            if self._newest is not None and bucket > self._newest:
+                self._advance(bucket)
+            counts = list(self._total_counts)
+            sums = list(self._total_sums)
+            if self._newest is not None:
+                slot = self._newest % self._bucket_count
+                counts = [total + count for total, count in zip(counts, self._counts[slot])]
+                sums = [total + value for total, value in zip(sums, self._sums[slot])]
+
+        samples = sum(counts)
+        dominant = max(range(len(counts)), key=counts.__getitem__) if samples else None
+        return {
+            "window": self.window,
+            "samples": samples,
+            "dominant_emotion": self.emotions[dominant] if dominant is not None else None,
+            "mean_intensity": sum(sums) / samples if samples else 0.0,
+            "shares": {emotion: count / samples if samples else 0.0 for emotion, count in zip(self.emotions, counts)},
+            "mean_intensities": {
+                emotion: total / count if count else 0.0
+                for emotion, total, count in zip(self.emotions, sums, counts)
+            }
+        }
@@ -1,13 +1,491 @@
 import cv2
+import importlib.util
+import math
+import os
+import queue
+import threading
+import time
 import numpy as np
-from typing import Dict, List, Tuple
-import random
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Classes of the FER emotion model, in output order
+FER_LABELS = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+
+# How the model classes map onto Ai.lonso's emotions
+FER_TO_EMOTION = {
+    "angry": "stressed",
+    "disgust": "stressed",
+    "fear": "worried",
+    "happy": "happy",
+    "sad": "worried",
+    "surprise": "surprised",
+    "neutral": "neutral"
+}
+
+# Happiness above this confidence is shown as excitement
+EXCITED_THRESHOLD = 0.85
+
+# The alt2 cascade copes better than the default one with caps and visors
+FACE_CASCADE = "haarcascade_frontalface_alt2.xml"
+
+class ModelRegistry:
+    """Process-wide cache of loaded models, each loaded exactly once on first use"""
+    
+    def __init__(self):
+        self._models = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+    
+    def get(self, name: str, loader: Callable[[], Any]) -> Any:
+        """Get a model, loading it with the loader if no thread has done so yet"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        # One lock per model, so a slow load does not block other models
+        with lock:
+            model = self._models.get(name)
+            if model is None:
+                model = loader()
+                self._models[name] = model
+        return model
+    
+    def loaded(self) -> List[str]:
+        """Names of the models loaded so far"""
+        return list(self._models)
+
+_registry = ModelRegistry()
+
+def get_model_registry() -> ModelRegistry:
+    """Get the registry shared by every session in the process"""
+    return _registry
+
+def load_fer_emotion_model() -> Any:
+    """Load the Keras emotion model bundled with fer and run a warm-up inference"""
+    # Imported here so the app starts without loading TensorFlow
+    from tensorflow.keras.models import load_model
+    
+    # Use the model file without importing the fer package and its extra dependencies
+    fer_spec = importlib.util.find_spec("fer")
+    if fer_spec is None:
+        raise ImportError("The fer package is required for emotion detection")
+    model = load_model(os.path.join(os.path.dirname(fer_spec.origin), "data", "emotion_model.hdf5"), compile=False)
+    
+    # The first call builds the inference graph, pay for it here instead of on a user's click
+    model(np.zeros((1,) + tuple(model.input_shape[1:]), dtype=np.float32), training=False)
+    return model
+
+class FaceEmotionClassifier:
+    """Finds faces with a Haar cascade and classifies them with the FER model in batches"""
+    
+    def __init__(self, detection_width: int = 200, min_face_size: int = 30, scale_factor: float = 1.05,
+                 min_neighbors: int = 2, face_margin: float = 0.1):
+        self.detection_width = detection_width
+        self.min_face_size = min_face_size
+        self.scale_factor = scale_factor
+        self.min_neighbors = min_neighbors
+        self.face_margin = face_margin
+        self._face_detector = None
+        self._model = None
+        self._input_size = None
+        # Reused downscaled copy of the frame for the cascade, so instances should not be shared across threads
+        self._detection_buffer = None
+    
+    def load(self):
+        """Load the face detector and get the shared emotion model on first use"""
+        if self._model is not None:
+            return
+        
+        self._face_detector = cv2.CascadeClassifier(os.path.join(cv2.data.haarcascades, FACE_CASCADE))
+        self._model = get_model_registry().get("fer_emotion", load_fer_emotion_model)
+        height, width = self._model.input_shape[1:3]
+        self._input_size = (width, height)
+    
+    def find_face(self, gray: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """Get the (x, y, width, height) box of the largest face in a grayscale frame"""
+        self.load()
+        
+        # Detect on a downscaled copy, the cascade cost grows with the pixel count
+        scale = min(1.0, self.detection_width / gray.shape[1])
+        height, width = gray.shape
+        shape = (max(1, int(round(height * scale))), max(1, int(round(width * scale))))
+        if self._detection_buffer is None or self._detection_buffer.shape != shape:
+            self._detection_buffer = np.empty(shape, dtype=np.uint8)
+        small = self._detection_buffer
+        cv2.resize(gray, (shape[1], shape[0]), dst=small, interpolation=cv2.INTER_AREA)
+        cv2.equalizeHist(small, dst=small)
+        scale = shape[1] / width
+        
+        faces = self._face_detector.detectMultiScale(
+            small, scaleFactor=self.scale_factor, minNeighbors=self.min_neighbors,
+            minSize=(self.min_face_size, self.min_face_size)
+        )
+        if len(faces) == 0:
+            return None
+        
+        x, y, width, height = max(faces, key=lambda face: face[2] * face[3])
+        return tuple(int(round(value / scale)) for value in (x, y, width, height))
+    
+    def crop_face(self, gray: np.ndarray, box: Tuple[int, int, int, int]) -> np.ndarray:
+        """Cut a square around a face box and resize it to the model input"""
+        self.load()
+        x, y, width, height = box
+        half = int(max(width, height) * (0.5 + self.face_margin))
+        center_x, center_y = x + width // 2, y + height // 2
+        
+        face = gray[max(0, center_y - half):center_y + half, max(0, center_x - half):center_x + half]
+        return cv2.resize(face, self._input_size, interpolation=cv2.INTER_AREA)
+    
+    def classify_faces(self, faces: np.ndarray) -> np.ndarray:
+        """Get class probabilities for a batch of face crops in one model call"""
+        self.load()
+        batch = faces.astype(np.float32)[..., np.newaxis]
+        # Scale to [-1, 1] as the model was trained
+        batch /= 127.5
+        batch -= 1.0
+        return np.asarray(self._model(batch, training=False))
+    
+    def predict(self, frames: List[np.ndarray]) -> List[Optional[np.ndarray]]:
+        """Class probabilities for the largest face in each BGR frame, None where there is no face"""
+        faces, face_frames = [], []
+        for index, frame in enumerate(frames):
+            gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            box = self.find_face(gray)
+            if box is not None:
+                faces.append(self.crop_face(gray, box))
+                face_frames.append(index)
+        
+        results = [None] * len(frames)
+        if faces:
+            for index, probabilities in zip(face_frames, self.classify_faces(np.stack(faces))):
+                results[index] = probabilities
+        return results
+
+class FrameIngestor:
+    """Turns uploaded images and camera frames into grayscale frames in reusable buffers
+    
+    JPEG uploads are decoded straight to grayscale at a reduced scale by
+    the JPEG decoder, and camera frames are read into the same capture
+    buffer every time. Color conversion and resizing write into a
+    preallocated output with dst=, so a steady stream of frames does not
+    allocate full-size arrays. Frames keep their aspect ratio and fill the
+    top-left of the output, and the returned frame is a view of that part
+    of the buffer, only valid until the next frame is ingested.
+    """
+    
+    # Decoder flags for grayscale decoding at 1, 1/2, 1/4 and 1/8 scale
+    REDUCED_GRAYSCALE = [
+        (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+        (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+        (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+        (1, cv2.IMREAD_GRAYSCALE)
+    ]
+    
+    def __init__(self, size: Tuple[int, int] = (640, 480)):
+        self.size = size
+        width, height = size
+        self.frame = np.empty((height, width), dtype=np.uint8)
+        self._capture_buffer = None
+        self._gray_buffer = None
+    
+    def from_bytes(self, data: bytes) -> Optional[np.ndarray]:
+        """Decode an encoded image (e.g. a camera snapshot upload), None if it cannot be decoded"""
+        encoded = np.frombuffer(data, dtype=np.uint8)
+        flag = self._decode_flag(data)
+        decoded = cv2.imdecode(encoded, flag)
+        if decoded is None:
+            return None
+        return self._fit(decoded)
+    
+    def from_capture(self, capture: "cv2.VideoCapture") -> Optional[np.ndarray]:
+        """Read the next camera frame, None if the camera returned nothing"""
+        ok, frame = capture.read(self._capture_buffer)
+        if not ok:
+            return None
+        self._capture_buffer = frame
+        return self.from_bgr(frame)
+    
+    def from_bgr(self, frame: np.ndarray) -> np.ndarray:
+        """Convert a BGR frame into the output buffer"""
+        output = self._output_view(frame.shape[1], frame.shape[0])
+        if frame.shape[:2] == output.shape:
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=output)
+        
+        if self._gray_buffer is None or self._gray_buffer.shape != frame.shape[:2]:
+            self._gray_buffer = np.empty(frame.shape[:2], dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buffer)
+        return self._fit(self._gray_buffer)
+    
+    def _fit(self, gray: np.ndarray) -> np.ndarray:
+        """Resize a grayscale image into the output buffer"""
+        output = self._output_view(gray.shape[1], gray.shape[0])
+        if gray.shape == output.shape:
+            np.copyto(output, gray)
+        else:
+            cv2.resize(gray, (output.shape[1], output.shape[0]), dst=output, interpolation=cv2.INTER_AREA)
+        return output
+    
+    def _output_view(self, width: int, height: int) -> np.ndarray:
+        """Largest top-left region of the output with the image's aspect ratio"""
+        scale = min(self.size[0] / width, self.size[1] / height, 1.0)
+        return self.frame[:max(1, int(height * scale)), :max(1, int(width * scale))]
+    
+    def _decode_flag(self, data: bytes) -> int:
+        """Pick the largest JPEG decode reduction that still covers the output size"""
+        image_size = _jpeg_size(data)
+        if image_size is None:
+            return cv2.IMREAD_GRAYSCALE
+        
+        # Decode no smaller than the aspect-preserving output size
+        scale = min(self.size[0] / image_size[0], self.size[1] / image_size[1])
+        for factor, flag in self.REDUCED_GRAYSCALE:
+            if scale * factor <= 1.0:
+                return flag
+        return cv2.IMREAD_GRAYSCALE
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """Read the (width, height) of a JPEG from its frame header without decoding it"""
+    if data[:2] != b"\xff\xd8":
+        return None
+    
+    position = 2
+    while position + 9 < len(data):
+        if data[position] != 0xFF:
+            return None
+        marker = data[position + 1]
+        length = (data[position + 2] << 8) | data[position + 3]
+        # Start of frame markers hold the image size, other markers are skipped
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height = (data[position + 5] << 8) | data[position + 6]
+            width = (data[position + 7] << 8) | data[position + 8]
+            return width, height
+        position += 2 + length
+    return None
+
+class EmotionHistory:
+    """Fixed-size ring buffer of detections with exponential smoothing
+    
+    Timestamps, emotion ids and intensities live in preallocated NumPy
+    arrays, so appending is O(1) and the oldest entries are overwritten
+    once the buffer is full. Each detection updates exponentially smoothed
+    per-emotion scores, and the stored emotion is the smoothed one, so a
+    single misclassified frame does not make the mirror flicker. Windowed
+    aggregates search and count directly on views of the buffer.
+    """
+    
+    def __init__(self, emotions: List[str], capacity: int = 4096, smoothing: float = 1.0):
+        self.emotions = list(emotions)
+        self.emotion_ids = {emotion: index for index, emotion in enumerate(self.emotions)}
+        self.capacity = capacity
+        self.smoothing = smoothing
+        
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.emotion_history = np.zeros(capacity, dtype=np.int8)
+        self.intensities = np.zeros(capacity, dtype=np.float32)
+        self._next = 0
+        self._count = 0
+        
+        self._scores = np.zeros(len(self.emotions), dtype=np.float64)
+        self._intensity = 0.0
+        self._last_timestamp = None
+        self.race_started_at = None
+        self.lap_started_at = None
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def append(self, emotion: str, intensity: float, timestamp: float = None) -> Tuple[str, float]:
+        """Record a detection and return the smoothed (emotion, intensity)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        
+        # Time-aware smoothing factor, so irregular frame rates smooth the same way
+        if self._last_timestamp is None:
+            alpha = 1.0
+        else:
+            alpha = 1.0 - math.exp(-max(timestamp - self._last_timestamp, 0.0) / self.smoothing)
+        self._last_timestamp = timestamp
+        
+        self._scores *= 1.0 - alpha
+        self._scores[self.emotion_ids[emotion]] += alpha
+        self._intensity += alpha * (intensity - self._intensity)
+        smoothed_id = int(np.argmax(self._scores))
+        
+        self.timestamps[self._next] = timestamp
+        self.emotion_history[self._next] = smoothed_id
+        self.intensities[self._next] = self._intensity
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        
+        if self.race_started_at is None:
+            self.race_started_at = timestamp
+        return self.emotions[smoothed_id], self._intensity
+    
+    def start_race(self, timestamp: float = None):
+        """Mark the start of the race for race aggregates"""
+        self.race_started_at = time.time() if timestamp is None else timestamp
+        self.lap_started_at = self.race_started_at
+    
+    def mark_lap(self, timestamp: float = None):
+        """Mark the start of a new lap for lap aggregates"""
+        self.lap_started_at = time.time() if timestamp is None else timestamp
+    
+    def _segments(self) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Views of the buffer in chronological order, split where it wraps"""
+        if self._count < self.capacity:
+            parts = [slice(0, self._count)]
+        else:
+            parts = [slice(self._next, self.capacity), slice(0, self._next)]
+        return [(self.timestamps[part], self.emotion_history[part], self.intensities[part]) for part in parts]
+    
+    def aggregate(self, since: float = None) -> Dict:
+        """Emotion counts and mean intensities of the entries since a timestamp"""
+        emotion_count = len(self.emotions)
+        counts = np.zeros(emotion_count, dtype=np.int64)
+        intensity_sums = np.zeros(emotion_count, dtype=np.float64)
+        
+        for timestamps, emotion_ids, intensities in self._segments():
+            first = 0 if since is None else int(np.searchsorted(timestamps, since))
+            counts += np.bincount(emotion_ids[first:], minlength=emotion_count)
+            intensity_sums += np.bincount(emotion_ids[first:], weights=intensities[first:], minlength=emotion_count)
+        
+        samples = int(counts.sum())
+        return {
+            "samples": samples,
+            "dominant_emotion": self.emotions[int(np.argmax(counts))] if samples else None,
+            "mean_intensity": float(intensity_sums.sum() / samples) if samples else 0.0,
+            "counts": dict(zip(self.emotions, counts.tolist())),
+            "mean_intensities": {
+                emotion: float(total / count) if count else 0.0
+                for emotion, total, count in zip(self.emotions, intensity_sums, counts)
+            }
+        }
+    
+    def last_seconds(self, seconds: float = 10.0, now: float = None) -> Dict:
+        """Aggregate of the last few seconds"""
+        return self.aggregate((time.time() if now is None else now) - seconds)
+    
+    def current_lap(self) -> Dict:
+        """Aggregate since the last lap mark"""
+        return self.aggregate(self.lap_started_at)
+    
+    def race(self) -> Dict:
+        """Aggregate since the race started"""
+        return self.aggregate(self.race_started_at)
+    
+    def latest(self, limit: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Copies of the most recent entries, oldest first"""
+        limit = min(limit, self._count)
+        indices = (self._next - limit + np.arange(limit)) % self.capacity
+        return self.timestamps[indices], self.emotion_history[indices], self.intensities[indices]
+
+class EmotionInferencePool:
+    """Worker threads that serve frames from every session with the shared model
+    
+    Frames submitted by any session go onto one queue. Each worker takes
+    whatever is waiting, up to max_batch frames, and runs face detection
+    and a single batched model call for all of them, so concurrent fans
+    share model calls instead of queuing for one each.
+    """
+    
+    def __init__(self, workers: int = None, max_batch: int = 8, batch_wait: float = 0.005):
+        # OpenCV and TensorFlow release the GIL, so workers run in parallel on separate cores
+        workers = workers or max(1, min(4, os.cpu_count() or 1))
+        self.max_batch = max_batch
+        self.batch_wait = batch_wait
+        self._requests = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"emotion-inference-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def submit(self, frame: np.ndarray) -> Future:
+        """Queue a BGR frame, the future resolves to class probabilities or None"""
+        future = Future()
+        self._requests.put((frame, future))
+        return future
+    
+    def predict(self, frames: List[np.ndarray], timeout: float = None) -> List[Optional[np.ndarray]]:
+        """Class probabilities for each frame, like FaceEmotionClassifier.predict"""
+        futures = [self.submit(frame) for frame in frames]
+        return [future.result(timeout) for future in futures]
+    
+    def pending(self) -> int:
+        """Frames waiting for a worker"""
+        return self._requests.qsize()
+    
+    def shutdown(self):
+        """Stop the workers once the queued frames are served"""
+        for _ in self._threads:
+            self._requests.put(None)
+        for thread in self._threads:
+            thread.join()
+    
+    def _work(self):
+        """Serve batches of queued frames until shut down"""
+        # Each worker has its own cascade, the model itself comes from the registry
+        classifier = FaceEmotionClassifier()
+        try:
+            classifier.load()
+        except Exception:
+            # Loading is retried by predict, which reports the error to the callers
+            pass
+        
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            
+            batch = [request]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.max_batch:
+                try:
+                    request = self._requests.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if request is None:
+                    # Leave the stop signal for after this batch
+                    self._requests.put(None)
+                    break
+                batch.append(request)
+            
+            batch = [(frame, future) for frame, future in batch if future.set_running_or_notify_cancel()]
+            try:
+                results = classifier.predict([frame for frame, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_emotion_inference_pool() -> EmotionInferencePool:
+    """Get the shared inference pool, starting it and loading the model in the background on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = EmotionInferencePool()
+        return _pool
 
 class EmotionDetector:
     """Handles emotion detection and mirroring functionality"""
     
-    def __init__(self):
+    def __init__(self, classifier: FaceEmotionClassifier = None, pool: EmotionInferencePool = None,
+                 history_size: int = 4096):
+        self.classifier = classifier or FaceEmotionClassifier()
+        # Frames go through the shared pool when one is given, otherwise through this session's classifier
+        self.pool = pool
+        
         self.emotions = ["happy", "excited", "worried", "neutral", "surprised", "stressed"]
+        self.history = EmotionHistory(self.emotions, capacity=history_size)
         self.emotion_intensities = {
             "happy": 0.8,
             "excited": 0.9,
@@ -27,51 +505,201 @@ class EmotionDetector:
         }
     
     def detect_emotion_from_image(self, image: np.ndarray) -> Tuple[str, float]:
-        """Detect emotion from an image (simulated)"""
-        # In a real implementation, this would use a trained emotion detection model
-        # For demo purposes, we'll return random emotions
-        emotion = random.choice(self.emotions)
-        intensity = self.emotion_intensities[emotion]
+        """Detect emotion from a BGR image"""
+        return self.detect_emotions_batch([image])[0]
+    
+    def detect_emotions_batch(self, frames: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """Detect emotions for several frames with a single model call"""
+        results = [self.interpret(probabilities) for probabilities in self._predict(frames)]
+        for emotion, intensity in results:
+            self.history.append(emotion, intensity)
+        return results
+    
+    def detect_emotion_from_webcam(self, camera_index: int = 0, frame_count: int = 4) -> Tuple[str, float]:
+        """Detect emotion from a short burst of webcam frames"""
+        capture = cv2.VideoCapture(camera_index)
+        try:
+            frames = [frame for ok, frame in (capture.read() for _ in range(frame_count)) if ok]
+        finally:
+            capture.release()
         
+        predictions = [p for p in self._predict(frames) if p is not None] if frames else []
+        emotion, intensity = self.interpret(np.mean(predictions, axis=0) if predictions else None)
+        self.history.append(emotion, intensity)
         return emotion, intensity
     
-    def detect_emotion_from_webcam(self) -> Tuple[str, float]:
-        """Detect emotion from webcam feed (simulated)"""
-        # Simulate webcam emotion detection
-        emotion = random.choice(self.emotions)
-        intensity = random.uniform(0.3, 1.0)
+    def _predict(self, frames: List[np.ndarray]) -> List[Optional[np.ndarray]]:
+        """Class probabilities for each frame"""
+        if self.pool is not None:
+            return self.pool.predict(frames)
+        return self.classifier.predict(frames)
+    
+    def interpret(self, probabilities: Optional[np.ndarray]) -> Tuple[str, float]:
+        """Turn model class probabilities into an (emotion, intensity) pair"""
+        if probabilities is None:
+            # No face in view
+            return "neutral", 0.0
+        
+        scores = {}
+        for label, probability in zip(FER_LABELS, probabilities):
+            emotion = FER_TO_EMOTION[label]
+            scores[emotion] = scores.get(emotion, 0.0) + float(probability)
         
+        emotion = max(scores, key=scores.get)
+        intensity = scores[emotion]
+        if emotion == "happy" and intensity >= EXCITED_THRESHOLD:
+            emotion = "excited"
         return emotion, intensity
     
     def get_ai_lonso_response(self, emotion: str) -> str:
         """Get Ai.lonso's response to detected emotion"""
         return self.ai_lonso_responses.get(emotion, "😊 Ai.lonso is here with you!")
     
-    def get_emotion_history(self) -> List[Dict]:
+    def get_emotion_history(self, limit: int = 10) -> List[Dict]:
         """Get recent emotion detection history"""
-        # Simulate emotion history
-        history = []
-        for i in range(10):
-            emotion = random.choice(self.emotions)
-            intensity = random.uniform(0.3, 1.0)
-            timestamp = f"14:{30+i}:{random.randint(0, 59):02d}"
-            
-            history.append({
-                "timestamp": timestamp,
-                "emotion": emotion,
-                "intensity": intensity
-            })
-        
-        return sorted(history, key=lambda x: x["timestamp"])
+        timestamps, emotion_ids, intensities = self.history.latest(limit)
+        return [{
+            "timestamp": time.strftime("%H:%M:%S", time.localtime(timestamp)),
+            "emotion": self.emotions[emotion_id],
+            "intensity": float(intensity)
+        } for timestamp, emotion_id, intensity in zip(timestamps, emotion_ids, intensities)]
     
-    def create_emotion_timeline(self) -> Dict:
+    def create_emotion_timeline(self, limit: int = 100) -> Dict:
         """Create emotion timeline data for visualization"""
-        history = self.get_emotion_history()
+        timestamps, emotion_ids, intensities = self.history.latest(limit)
         
         return {
-            "timestamps": [item["timestamp"] for item in history],
-            "emotions": [item["emotion"] for item in history],
-            "intensities": [item["intensity"] for item in history]
+            "timestamps": [time.strftime("%H:%M:%S", time.localtime(timestamp)) for timestamp in timestamps],
+            "emotions": [self.emotions[emotion_id] for emotion_id in emotion_ids],
+            "intensities": intensities.tolist()
         }
 
-
+class EmotionFrameScheduler:
+    """Runs the full emotion detector only on some webcam frames and tracks the face in between
+    
+    The detector runs every k frames, when the picture changes more than a
+    motion threshold, or when the tracker loses the face. In between, the
+    face box is followed with template matching around its last position
+    and the last emotion is kept. k adapts so the average processing time
+    per frame stays within the target frame budget.
+    """
+    
+    def __init__(self, detector: EmotionDetector = None, target_fps: float = 15.0, initial_k: int = 5,
+                 max_k: int = 30, motion_threshold: float = 12.0, track_threshold: float = 0.6,
+                 stats_window: int = 60):
+        self.detector = detector or EmotionDetector()
+        self.frame_budget = 1.0 / target_fps
+        self.k = initial_k
+        self.max_k = max_k
+        self.motion_threshold = motion_threshold
+        self.track_threshold = track_threshold
+        
+        self.box = None
+        self.emotion = ("neutral", 0.0)
+        self._template = None
+        self._previous_thumbnail = None
+        self._frames_since_detection = 0
+        self._detect_cost = None
+        self._track_cost = None
+        self._frames = deque(maxlen=stats_window)
+    
+    def process(self, frame: np.ndarray) -> Dict:
+        """Get the current emotion for a BGR frame, detecting only when needed"""
+        started = time.perf_counter()
+        gray = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        
+        thumbnail = cv2.resize(gray, (64, 48), interpolation=cv2.INTER_AREA)
+        motion = 0.0
+        if self._previous_thumbnail is not None:
+            motion = float(cv2.absdiff(thumbnail, self._previous_thumbnail).mean())
+        self._previous_thumbnail = thumbnail
+        
+        detect = (self.box is None or self._frames_since_detection + 1 >= self.k
+                  or motion > self.motion_threshold)
+        if not detect and not self._track(gray):
+            detect = True
+        
+        if detect:
+            self._detect(gray)
+        else:
+            self._frames_since_detection += 1
+        
+        elapsed = time.perf_counter() - started
+        self._update_costs(detect, elapsed)
+        self._frames.append((time.perf_counter(), detect))
+        
+        emotion, intensity = self.emotion
+        return {"emotion": emotion, "intensity": intensity, "box": self.box, "detected": detect,
+                "motion": motion}
+    
+    def _detect(self, gray: np.ndarray):
+        """Run face detection and emotion classification"""
+        classifier = self.detector.classifier
+        self._frames_since_detection = 0
+        self.box = classifier.find_face(gray)
+        if self.box is None:
+            self._template = None
+            self.emotion = self.detector.history.append(*self.detector.interpret(None))
+            return
+        
+        face = classifier.crop_face(gray, self.box)
+        emotion, intensity = self.detector.interpret(classifier.classify_faces(face[np.newaxis])[0])
+        self.emotion = self.detector.history.append(emotion, intensity)
+        x, y, width, height = self.box
+        self._template = gray[y:y + height, x:x + width].copy()
+    
+    def _track(self, gray: np.ndarray) -> bool:
+        """Follow the face box with template matching, returning False if it was lost"""
+        if self._template is None or self._template.size == 0:
+            return False
+        
+        x, y, width, height = self.box
+        # Search a region of half a face around the last position
+        margin_x, margin_y = width // 2, height // 2
+        left, top = max(0, x - margin_x), max(0, y - margin_y)
+        region = gray[top:y + height + margin_y, left:x + width + margin_x]
+        if region.shape[0] < self._template.shape[0] or region.shape[1] < self._template.shape[1]:
+            return False
+        
+        scores = cv2.matchTemplate(region, self._template, cv2.TM_CCOEFF_NORMED)
+        _, best, _, (match_x, match_y) = cv2.minMaxLoc(scores)
+        if best < self.track_threshold:
+            return False
+        
+        self.box = (left + match_x, top + match_y, width, height)
+        return True
+    
+    def _update_costs(self, detected: bool, elapsed: float):
+        """Track detection and tracking costs and pick k to fit the frame budget"""
+        if detected:
+            self._detect_cost = elapsed if self._detect_cost is None else 0.8 * self._detect_cost + 0.2 * elapsed
+        else:
+            self._track_cost = elapsed if self._track_cost is None else 0.8 * self._track_cost + 0.2 * elapsed
+        
+        if self._detect_cost is None or self._track_cost is None:
+            return
+        
+        # Average cost over k frames is (detect + (k - 1) * track) / k, solve for the budget
+        spare = self.frame_budget - self._track_cost
+        if spare <= 0:
+            self.k = self.max_k
+        else:
+            needed = math.ceil((self._detect_cost - self._track_cost) / spare)
+            self.k = max(1, min(self.max_k, needed))
+    
+    def stats(self) -> Dict:
+        """Get the achieved frame rate and the share of frames running the detector"""
+        frames = len(self._frames)
+        if frames < 2:
+            return {"fps": 0.0, "duty_cycle": 0.0, "k": self.k, "frames": frames}
+        
+        span = self._frames[-1][0] - self._frames[0][0]
+        detections = sum(1 for _, detected in self._frames if detected)
+        return {
+            "fps": (frames - 1) / span if span > 0 else 0.0,
+            "duty_cycle": detections / frames,
+            "k": self.k,
+            "frames": frames,
+            "detect_ms": (self._detect_cost or 0.0) * 1000,
+            "track_ms": (self._track_cost or 0.0) * 1000
+        }
@@ -0,0 +1,171 @@
+"""
+Compact binary encoding of haptic waveforms for device fan-out.
+
+Waveforms are quantized to uint8 (0-255 over the 0.0-1.0 amplitude
+range) and cut into frames. Each frame stores the sample deltas with
+PackBits-style run-length encoding, so steady sections such as the
+safety car pattern, silence and linear envelope ramps collapse to a few
+bytes. Every frame starts from zero, so a device can join the stream at
+any frame boundary.
+
+Frame layout (little endian):
+    magic       2 bytes   b"HF"
+    sample_rate uint16    samples per second
+    start       uint32    index of the first sample in the track
+    count       uint16    samples in the frame
+    length      uint32    payload bytes that follow
+
+Payload tokens:
+    0-127       literal run, the next (token + 1) delta bytes
+    128-255     repeat run, the next delta byte (token - 126) times
+"""
+
+import struct
+from typing import Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+FRAME_MAGIC = b"HF"
+FRAME_HEADER = struct.Struct("<2sHIHI")
+MAX_FRAME_SAMPLES = 0xFFFF
+
+_MAX_LITERAL = 128
+_MAX_REPEAT = 129
+
+
+def quantize(waveform: np.ndarray) -> np.ndarray:
+    """Convert an amplitude waveform to uint8 levels"""
+    levels = np.clip(waveform, 0.0, 1.0) * 255.0
+    return np.rint(levels).astype(np.uint8)
+
+
+def dequantize(levels: np.ndarray) -> np.ndarray:
+    """Convert uint8 levels back to float32 amplitudes"""
+    return levels.astype(np.float32) / 255.0
+
+
+def encode_frame(levels: np.ndarray, start: int, sample_rate: int) -> bytes:
+    """Encode one frame of quantized samples"""
+    if len(levels) > MAX_FRAME_SAMPLES:
+        raise ValueError(f"A frame holds at most {MAX_FRAME_SAMPLES} samples")
+
+    # uint8 arithmetic wraps, so the deltas round-trip through a uint8 cumulative sum
+    deltas = np.diff(levels, prepend=np.uint8(0))
+    payload = _pack_runs(deltas)
+    return FRAME_HEADER.pack(FRAME_MAGIC, sample_rate, start, len(levels), len(payload)) + payload
+
+
+def encode_waveform(waveform: np.ndarray, sample_rate: int, frame_duration: float = 0.2,
+                    start: int = 0) -> Iterator[bytes]:
+    """Quantize a waveform and yield it as a sequence of frames"""
+    levels = quantize(waveform)
+    frame_samples = min(MAX_FRAME_SAMPLES, max(1, int(round(frame_duration * sample_rate))))
+    for first in range(0, len(levels), frame_samples):
+        yield encode_frame(levels[first:first + frame_samples], start + first, sample_rate)
+
+
+def decode_frame(data: bytes, offset: int = 0) -> Tuple[int, int, np.ndarray, int]:
+    """Decode the frame at an offset into (sample rate, start, levels, next offset)"""
+    magic, sample_rate, start, count, length = FRAME_HEADER.unpack_from(data, offset)
+    if magic != FRAME_MAGIC:
+        raise ValueError(f"No haptic frame at offset {offset}")
+
+    payload_start = offset + FRAME_HEADER.size
+    payload_end = payload_start + length
+    if payload_end > len(data):
+        raise ValueError("Truncated haptic frame")
+
+    deltas = _unpack_runs(memoryview(data)[payload_start:payload_end])
+    if len(deltas) != count:
+        raise ValueError(f"Frame declares {count} samples but holds {len(deltas)}")
+    return sample_rate, start, np.cumsum(deltas, dtype=np.uint8), payload_end
+
+
+def decode_stream(data: bytes) -> Iterator[Tuple[float, np.ndarray]]:
+    """Decode a complete byte stream into (start time, amplitudes) frames"""
+    offset = 0
+    while offset < len(data):
+        sample_rate, start, levels, offset = decode_frame(data, offset)
+        yield start / sample_rate, dequantize(levels)
+
+
+class HapticStreamDecoder:
+    """Incremental decoder for frames arriving in arbitrary network chunks"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[Tuple[float, np.ndarray]]:
+        """Add received bytes and decode every frame that is now complete"""
+        self._buffer += data
+        frames = []
+        offset = 0
+        while len(self._buffer) - offset >= FRAME_HEADER.size:
+            length = FRAME_HEADER.unpack_from(self._buffer, offset)[4]
+            if len(self._buffer) - offset < FRAME_HEADER.size + length:
+                break
+            sample_rate, start, levels, offset = decode_frame(self._buffer, offset)
+            frames.append((start / sample_rate, dequantize(levels)))
+        del self._buffer[:offset]
+        return frames
+
+    @property
+    def pending(self) -> int:
+        """Bytes received but not yet decoded"""
+        return len(self._buffer)
+
+
+def encoded_size(frames: Iterable[bytes]) -> int:
+    """Total size of a sequence of frames"""
+    return sum(len(frame) for frame in frames)
+
+
+def _pack_runs(deltas: np.ndarray) -> bytes:
+    """Run-length encode a uint8 array"""
+    count = len(deltas)
+    if not count:
+        return b""
+
+    data = deltas.tobytes()
+    run_starts = np.flatnonzero(deltas[1:] != deltas[:-1]) + 1
+    bounds = np.concatenate(([0], run_starts, [count])).tolist()
+
+    out = bytearray()
+    literal_start = 0
+    for start, end in zip(bounds, bounds[1:]):
+        if end - start < 2:
+            continue
+        _pack_literal(out, data, literal_start, start)
+        while end - start >= 2:
+            length = min(end - start, _MAX_REPEAT)
+            out.append(length + 126)
+            out.append(data[start])
+            start += length
+        literal_start = start
+    _pack_literal(out, data, literal_start, count)
+    return bytes(out)
+
+
+def _pack_literal(out: bytearray, data: bytes, start: int, end: int):
+    """Append literal tokens for data[start:end]"""
+    while start < end:
+        length = min(end - start, _MAX_LITERAL)
+        out.append(length - 1)
+        out += data[start:start + length]
+        start += length
+
+
+def _unpack_runs(payload: memoryview) -> np.ndarray:
+    """Expand run-length encoded tokens back to a uint8 array"""
+    parts = []
+    position = 0
+    while position < len(payload):
+        token = payload[position]
+        position += 1
+        if token < _MAX_LITERAL:
+            parts.append(payload[position:position + token + 1])
+            position += token + 1
+        else:
+            parts.append(bytes(payload[position:position + 1]) * (token - 126))
+            position += 1
+    return np.frombuffer(b"".join(parts), dtype=np.uint8)
@@ -0,0 +1,193 @@
+"""
+Async fan-out of haptic events to many devices.
+
+Each published event is rendered by HapticSimulator and encoded into
+binary frames once, and the same frame bytes are queued for every
+device. Every device has its own sender task with a token bucket rate
+limit. When a device falls behind, its pending frames are coalesced into
+a single send, and once the backlog passes a limit the oldest frames are
+dropped, since a late vibration is worse than a missing one. Delivery
+latency from publish to device receipt is recorded in a histogram.
+"""
+
+import asyncio
+import time
+from bisect import bisect_right
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from utils.haptic_codec import encode_waveform
+from utils.haptic_simulator import HapticSimulator
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0]
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of delivery latencies"""
+
+    def __init__(self, buckets: List[float] = None):
+        self.buckets = buckets or LATENCY_BUCKETS
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0
+        self.maximum = 0.0
+
+    def record(self, latency: float, count: int = 1):
+        """Add one or more samples with the same latency"""
+        self.counts[bisect_right(self.buckets, latency)] += count
+        self.total += count
+        self.maximum = max(self.maximum, latency)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given percentile"""
+        if not self.total:
+            return 0.0
+        target = fraction * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else self.maximum
+        return self.maximum
+
+    def summary(self) -> Dict:
+        """Get bucket counts and headline percentiles"""
+        labels = [f"<={bound * 1000:g}ms" for bound in self.buckets] + [f">{self.buckets[-1] * 1000:g}ms"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.total,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": self.maximum
+        }
+
+
+class SimulatedDevice:
+    """In-process stand-in for a device connection with a fixed network delay"""
+
+    def __init__(self, device_id: int, delay: float = 0.0):
+        self.device_id = device_id
+        self.delay = delay
+        self.bytes_received = 0
+        self.sends = 0
+
+    async def send(self, payload: bytes):
+        """Deliver a payload, taking as long as the simulated link does"""
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.bytes_received += len(payload)
+        self.sends += 1
+
+
+class _DeviceChannel:
+    """Pending frames and rate limit state for one device"""
+
+    def __init__(self, device, rate: float, burst: int):
+        self.device = device
+        self.rate = rate
+        self.tokens = float(burst)
+        self.burst = burst
+        self.refilled_at = time.monotonic()
+        self.pending = deque()
+        self.wakeup = asyncio.Event()
+        self.sends = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    async def acquire(self):
+        """Wait for a token from the device's bucket"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+        if self.tokens < 1.0:
+            await asyncio.sleep((1.0 - self.tokens) / self.rate)
+            self.tokens = 1.0
+            self.refilled_at = time.monotonic()
+        self.tokens -= 1.0
+
+
+class HapticDispatcher:
+    """Pushes encoded haptic frames to many devices with per-device rate limits"""
+
+    def __init__(self, devices: Iterable, simulator: HapticSimulator = None, rate: float = 20.0,
+                 burst: int = 5, max_pending: int = 50, frame_duration: float = 0.2):
+        self.simulator = simulator or HapticSimulator()
+        self.frame_duration = frame_duration
+        self.max_pending = max_pending
+        self.histogram = LatencyHistogram()
+        self._channels = [_DeviceChannel(device, rate, burst) for device in devices]
+        self._tasks = []
+        self._closed = False
+        self._published = 0
+
+    async def start(self):
+        """Start one sender task per device"""
+        self._tasks = [asyncio.create_task(self._run_channel(channel)) for channel in self._channels]
+
+    def publish(self, event_type: str, intensity: float, duration: float) -> int:
+        """Render an event once and queue its frames for every device"""
+        waveform = self.simulator.generate_waveform(event_type, intensity, duration)
+        frames = list(encode_waveform(waveform, self.simulator.sample_rate, self.frame_duration))
+        published_at = time.monotonic()
+        self._published += 1
+
+        for channel in self._channels:
+            pending = channel.pending
+            pending.extend((published_at, frame) for frame in frames)
+            overflow = len(pending) - self.max_pending
+            if overflow > 0:
+                for _ in range(overflow):
+                    pending.popleft()
+                channel.dropped += overflow
+            channel.wakeup.set()
+        return len(frames)
+
+    async def close(self):
+        """Deliver what is pending and stop the sender tasks"""
+        self._closed = True
+        for channel in self._channels:
+            channel.wakeup.set()
+        await asyncio.gather(*self._tasks)
+
+    async def _run_channel(self, channel: _DeviceChannel):
+        """Send a device's pending frames, coalescing everything queued since its last send"""
+        while True:
+            if not channel.pending:
+                if self._closed:
+                    return
+                channel.wakeup.clear()
+                await channel.wakeup.wait()
+                continue
+
+            await channel.acquire()
+            batch = list(channel.pending)
+            channel.pending.clear()
+            if len(batch) > 1:
+                channel.coalesced += len(batch) - 1
+
+            await channel.device.send(b"".join(frame for _, frame in batch))
+            channel.sends += 1
+            received_at = time.monotonic()
+            # Frames of one event share a publish time, so record them together
+            for published_at, frames in groupby(batch, key=itemgetter(0)):
+                self.histogram.record(received_at - published_at, sum(1 for _ in frames))
+
+    def metrics(self) -> Dict:
+        """Get delivery counters and the latency histogram"""
+        pending = np.fromiter((len(channel.pending) for channel in self._channels), dtype=np.int64,
+                              count=len(self._channels))
+        return {
+            "devices": len(self._channels),
+            "events_published": self._published,
+            "sends": sum(channel.sends for channel in self._channels),
+            "frames_delivered": self.histogram.total,
+            "frames_coalesced": sum(channel.coalesced for channel in self._channels),
+            "frames_dropped": sum(channel.dropped for channel in self._channels),
+            "max_pending": int(pending.max()) if len(pending) else 0,
+            "latency": self.histogram.summary()
+        }
@@ -2,10 +2,15 @@ import numpy as np
 import random
 from typing import Dict, List
 
+STEP_DURATION = 0.2  # Each vibration in a pattern lasts 0.2 seconds
+DEFAULT_SAMPLE_RATE = 1000
+
 class HapticSimulator:
     """Handles haptic vibration patterns for F1 events"""
     
-    def __init__(self):
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        
         self.event_patterns = {
             "overtake": [0.8, 0.6, 0.9, 0.7, 0.5],
             "crash": [1.0, 0.3, 1.0, 0.2, 0.8, 0.4],
@@ -21,32 +26,87 @@ class HapticSimulator:
             "pit_stop": "Rhythmic vibrations matching pit stop activities",
             "safety_car": "Steady, consistent vibrations representing safety car pace"
         }
+        
+        # Attack and decay times in seconds for the waveform envelope
+        self.event_envelopes = {
+            "overtake": (0.05, 0.2),
+            "crash": (0.005, 0.5),
+            "finish": (0.1, 0.4),
+            "pit_stop": (0.02, 0.1),
+            "safety_car": (0.3, 0.3)
+        }
+        
+        # One cycle of each pattern sampled at the sample rate, built on first use
+        self._cycles = {}
     
     def trigger_event(self, event_type: str, intensity: float, duration: float) -> Dict:
         """Trigger a haptic event"""
         if event_type.lower() not in self.event_patterns:
             event_type = "overtake"  # Default fallback
         
-        pattern = self.event_patterns[event_type.lower()]
-        
-        # Scale pattern based on intensity and duration
-        scaled_pattern = [p * intensity for p in pattern]
+        pattern = np.asarray(self.event_patterns[event_type.lower()])
+        waveform = self.generate_waveform(event_type, intensity, duration)
         
-        # Adjust pattern length based on duration
-        pattern_duration = len(pattern) * 0.2  # Each vibration lasts 0.2 seconds
-        if duration > pattern_duration:
-            # Repeat pattern to fill duration
-            repetitions = int(duration / pattern_duration)
-            scaled_pattern = scaled_pattern * repetitions
+        # One step for every started step of the waveform, so both cover the same time
+        steps = -(-len(waveform) // self._step_samples())
+        scaled_pattern = np.resize(pattern, steps) * intensity
         
         return {
             "event_type": event_type,
-            "pattern": scaled_pattern,
+            "pattern": scaled_pattern.tolist(),
+            "waveform": waveform,
+            "sample_rate": self.sample_rate,
             "duration": duration,
             "intensity": intensity,
             "description": self.event_descriptions.get(event_type.lower(), "Custom haptic event")
         }
     
+    def generate_waveform(self, event_type: str, intensity: float, duration: float) -> np.ndarray:
+        """Sample an event's amplitude over exactly the given duration"""
+        event_type = event_type.lower()
+        if event_type not in self.event_patterns:
+            event_type = "overtake"
+        
+        samples = self._sample_count(duration)
+        cycle = self._get_cycle(event_type)
+        waveform = np.resize(cycle, samples)
+        
+        attack, decay = self.event_envelopes.get(event_type, (0.0, 0.0))
+        waveform *= self._envelope(samples, attack, decay)
+        waveform *= intensity
+        return waveform
+    
+    def _sample_count(self, duration: float) -> int:
+        """Number of samples covering a duration, rejecting negative durations"""
+        if duration < 0:
+            raise ValueError(f"Haptic event duration must not be negative, got {duration}")
+        return int(round(duration * self.sample_rate))
+    
+    def _step_samples(self) -> int:
+        """Number of samples in one pattern step"""
+        return max(1, int(round(STEP_DURATION * self.sample_rate)))
+    
+    def _get_cycle(self, event_type: str) -> np.ndarray:
+        """Get one sampled cycle of an event pattern"""
+        cycle = self._cycles.get(event_type)
+        if cycle is None:
+            cycle = np.repeat(np.asarray(self.event_patterns[event_type], dtype=np.float32), self._step_samples())
+            cycle.flags.writeable = False
+            self._cycles[event_type] = cycle
+        return cycle
+    
+    def _envelope(self, samples: int, attack: float, decay: float) -> np.ndarray:
+        """Linear attack and decay ramps, shortened to fit short events"""
+        envelope = np.ones(samples, dtype=np.float32)
+        attack_samples = min(int(attack * self.sample_rate), samples // 2)
+        decay_samples = min(int(decay * self.sample_rate), samples - attack_samples)
+        
+        if attack_samples:
+            envelope[:attack_samples] = np.linspace(0.0, 1.0, attack_samples, endpoint=False)
+        if decay_samples:
+            envelope[samples - decay_samples:] = np.linspace(1.0, 0.0, decay_samples)
+        return envelope
+    
     def get_pattern(self, event_type: str) -> List[float]:
         """Get vibration pattern for a specific event"""
         return self.event_patterns.get(event_type.lower(), [0.5, 0.5, 0.5])
@@ -0,0 +1,112 @@
+"""
+Precomputed haptic track for a whole race.
+
+Timestamped race events are rendered once into a single amplitude buffer
+at the simulator's sample rate. Overlapping events of the same priority
+are summed, events of a higher priority duck everything below them (a
+crash is felt over the overtake it interrupts), and the result is
+clipped to the actuator range. Devices then pull fixed windows of the
+buffer by time range as views, without recomputing the race.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from utils.haptic_simulator import HapticSimulator
+
+DEFAULT_PRIORITIES = {
+    "crash": 4,
+    "finish": 3,
+    "safety_car": 2,
+    "overtake": 1,
+    "pit_stop": 1
+}
+
+
+class HapticTrack:
+    """Mixed amplitude buffer of a race's haptic events, served in chunks"""
+
+    def __init__(self, events: Iterable[Dict], simulator: HapticSimulator = None,
+                 priorities: Dict[str, int] = None, duck_gain: float = 0.25,
+                 max_amplitude: float = 1.0):
+        self.simulator = simulator or HapticSimulator()
+        self.sample_rate = self.simulator.sample_rate
+        self.priorities = priorities or DEFAULT_PRIORITIES
+        self.duck_gain = duck_gain
+        self.max_amplitude = max_amplitude
+        self.events = sorted(events, key=lambda event: event["timestamp"])
+        self.buffer = self._render()
+
+    @property
+    def duration(self) -> float:
+        """Length of the track in seconds"""
+        return len(self.buffer) / self.sample_rate
+
+    def _render(self) -> np.ndarray:
+        """Mix every event into one clipped buffer"""
+        end = max((event["timestamp"] + event["duration"] for event in self.events), default=0.0)
+        buffer = np.zeros(int(round(end * self.sample_rate)), dtype=np.float32)
+        # Samples already claimed by a higher priority event
+        covered = np.zeros(len(buffer), dtype=bool)
+
+        levels = {}
+        for event in self.events:
+            levels.setdefault(self.priorities.get(event["event_type"].lower(), 0), []).append(event)
+
+        for level in sorted(levels, reverse=True):
+            windows = []
+            for event in levels[level]:
+                waveform = self.simulator.generate_waveform(event["event_type"], event["intensity"],
+                                                            event["duration"])
+                start = int(round(event["timestamp"] * self.sample_rate))
+                stop = min(start + len(waveform), len(buffer))
+                waveform = waveform[:stop - start]
+
+                ducked = covered[start:stop]
+                if ducked.any():
+                    waveform[ducked] *= self.duck_gain
+                buffer[start:stop] += waveform
+                windows.append((start, stop))
+
+            # Same priority events mix at full level, so mark coverage after the whole level
+            for start, stop in windows:
+                covered[start:stop] = True
+
+        np.clip(buffer, 0.0, self.max_amplitude, out=buffer)
+        buffer.flags.writeable = False
+        return buffer
+
+    def chunk(self, start: float, end: float) -> np.ndarray:
+        """Get the samples between two times in seconds, as a read-only view"""
+        first = max(0, int(round(start * self.sample_rate)))
+        last = max(first, int(round(end * self.sample_rate)))
+        return self.buffer[first:last]
+
+    def iter_chunks(self, window: float = 0.2, start: float = 0.0) -> Iterator[Tuple[float, np.ndarray]]:
+        """Yield (start time, samples) windows from a point in the race to the end"""
+        step = max(1, int(round(window * self.sample_rate)))
+        for first in range(max(0, int(round(start * self.sample_rate))), len(self.buffer), step):
+            yield first / self.sample_rate, self.buffer[first:first + step]
+
+    def events_between(self, start: float, end: float) -> List[Dict]:
+        """Get the events overlapping a time range"""
+        return [event for event in self.events
+                if event["timestamp"] < end and event["timestamp"] + event["duration"] > start]
+
+
+def simulate_race_track(simulator: HapticSimulator = None) -> HapticTrack:
+    """Render a sample race where several events overlap"""
+    race_events = [
+        (0.0, "finish", 0.8, 2.0),
+        (1.5, "overtake", 0.9, 1.5),
+        (2.5, "pit_stop", 0.7, 3.0),
+        (4.0, "overtake", 0.8, 1.5),
+        (4.5, "crash", 1.0, 2.5),
+        (6.0, "safety_car", 0.6, 4.0),
+        (10.0, "finish", 0.9, 3.0)
+    ]
+    return HapticTrack([
+        {"timestamp": timestamp, "event_type": event_type, "intensity": intensity, "duration": duration}
+        for timestamp, event_type, intensity, duration in race_events
+    ], simulator)
@@ -0,0 +1,165 @@
+"""
+Full-text search over historical F1 moments.
+
+Every event's type, driver or team, description, impact and similarity
+text is tokenized into an inverted index of term -> (event ids, BM25
+weights). The weights are precomputed when the index is built, so a
+query only adds up the posting arrays of its own terms. The best scores
+among the events holding the rarest query term give a lower bound on
+the k-th best score, which narrows the ranking to a handful of
+candidates. Ties are broken by event order, so results are
+deterministic.
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+INDEXED_FIELDS = ("type", "driver", "team", "event", "impact", "similarity")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "by", "for", "from", "has", "in", "into", "is", "it", "its",
+    "of", "on", "or", "the", "to", "was", "were", "with"
+}
+
+# Race vocabulary that describes the same kind of moment in other words
+QUERY_EXPANSIONS = {
+    "accident": ["crash"],
+    "collision": ["crash"],
+    "collide": ["crash"],
+    "pass": ["overtake"],
+    "rain": ["weather", "wet"],
+    "wet": ["weather", "rain"],
+    "tyre": ["tire"],
+    "box": ["pit"],
+    "vsc": ["virtual", "safety", "car"]
+}
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+@lru_cache(maxsize=65536)
+def normalize_term(word: str) -> str:
+    """Fold plurals and verb endings so that crash, crashes and crashed share a term"""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif (word.endswith("es") and word[-3] in "sxz") or word.endswith(("ches", "shes")):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    elif word.endswith("ing") and len(word) > 5:
+        word = word[:-3]
+    elif word.endswith("ed") and len(word) > 4:
+        word = word[:-2]
+    # overtake, overtakes and overtaking all end up as overtak
+    return word[:-1] if word.endswith("e") and len(word) > 3 else word
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into normalized index terms"""
+    return [normalize_term(word) for word in _TOKEN_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+
+
+_TERM_EXPANSIONS = {
+    normalize_term(word): [normalize_term(expansion) for expansion in expansions]
+    for word, expansions in QUERY_EXPANSIONS.items()
+}
+
+
+class HistoricalEventIndex:
+    """BM25 ranked inverted index over historical event dicts"""
+
+    def __init__(self, events: Iterable[Dict], fields: Tuple[str, ...] = INDEXED_FIELDS,
+                 k1: float = 1.2, b: float = 0.75):
+        self.events = list(events)
+        self.fields = fields
+        self.k1 = k1
+        self.b = b
+
+        term_counts = []
+        lengths = np.empty(len(self.events), dtype=np.float32)
+        document_frequency = Counter()
+        for event_id, event in enumerate(self.events):
+            counts = Counter(tokenize(" ".join(str(event.get(field, "")) for field in fields)))
+            term_counts.append(counts)
+            lengths[event_id] = sum(counts.values())
+            document_frequency.update(counts.keys())
+
+        # Length normalization of each event, shared by all of its terms
+        average_length = float(lengths.mean()) if len(lengths) and lengths.mean() > 0 else 1.0
+        norms = (k1 * (1.0 - b + b * lengths / average_length)).tolist()
+
+        postings = {}
+        for event_id, counts in enumerate(term_counts):
+            norm = norms[event_id]
+            for term, count in counts.items():
+                postings.setdefault(term, ([], []))
+                ids, weights = postings[term]
+                ids.append(event_id)
+                weights.append(count * (k1 + 1.0) / (count + norm))
+
+        event_count = len(self.events)
+        self._postings = {}
+        for term, (ids, weights) in postings.items():
+            frequency = document_frequency[term]
+            idf = math.log(1.0 + (event_count - frequency + 0.5) / (frequency + 0.5))
+            self._postings[term] = (np.array(ids, dtype=np.int32),
+                                    np.array(weights, dtype=np.float32) * np.float32(idf))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct terms in the index"""
+        return len(self._postings)
+
+    def query_terms(self, text: str) -> Counter:
+        """Normalized query terms with their expansions"""
+        terms = Counter()
+        for word in _TOKEN_PATTERN.findall(text.lower()):
+            if word in STOPWORDS:
+                continue
+            term = normalize_term(word)
+            terms[term] += 1
+            # Looked up by term, so passes, passing and passed all expand like pass
+            for expansion in _TERM_EXPANSIONS.get(term, ()):
+                terms[expansion] += 1
+        return terms
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[Dict, float]]:
+        """Get up to k (event, score) pairs most similar to the query, best first"""
+        matched = sorted(((self._postings[term], count) for term, count in self.query_terms(query).items()
+                          if term in self._postings), key=lambda item: len(item[0][0]))
+        if not matched or k <= 0:
+            return []
+
+        ids = np.concatenate([ids for (ids, _), _ in matched])
+        weights = np.concatenate([weights * count if count > 1 else weights for (_, weights), count in matched])
+        scores = np.bincount(ids, weights, minlength=len(self.events))
+
+        # The k best events sharing the rarest term bound the k-th best score from below
+        rarest = matched[0][0][0]
+        if len(rarest) >= k:
+            floor = np.partition(scores[rarest], len(rarest) - k)[len(rarest) - k]
+            candidates = np.flatnonzero(scores >= floor)
+        else:
+            candidates = np.flatnonzero(scores)
+        candidate_scores = scores[candidates]
+
+        if len(candidates) > k:
+            threshold = np.partition(candidate_scores, len(candidates) - k)[len(candidates) - k]
+            above = np.flatnonzero(candidate_scores > threshold)
+            # Candidates are in event order, so the earliest tied events take the remaining places
+            tied = np.flatnonzero(candidate_scores == threshold)[:k - len(above)]
+            keep = np.concatenate((above, tied))
+            candidates, candidate_scores = candidates[keep], candidate_scores[keep]
+        order = np.lexsort((candidates, -candidate_scores))
+        return [(self.events[event_id], score)
+                for event_id, score in zip(candidates[order].tolist(), candidate_scores[order].tolist())]
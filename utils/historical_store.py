@@ -0,0 +1,277 @@
+"""
+SQLite store of historical F1 events for the Memory Palace.
+
+The events and periods are edited in assets/historical_events.json. The
+build step loads them into an SQLite file with indexes on year, event
+type, driver and team. Rows are numbered in timeline order, so a
+filtered query reads matching ids straight off an index in (year, id)
+order and picks the events from the timeline, which is loaded once.
+The store records a hash of the JSON it was built from. When the
+compiled file is missing, unreadable or was built from a different
+version of the JSON, the store is built in memory from the JSON instead.
+File times are not compared, since a git checkout resets them.
+
+Usage:
+    python -m utils.historical_store build
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils.translation_store import source_file_hash
+
+ASSETS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+DEFAULT_SOURCE_PATH = os.path.join(ASSETS_PATH, "historical_events.json")
+DEFAULT_STORE_PATH = os.path.join(ASSETS_PATH, "historical_events.db")
+
+EVENT_COLUMNS = ("year", "type", "driver", "team", "event", "impact", "similarity")
+
+SCHEMA = """
+CREATE TABLE events (
+    id INTEGER PRIMARY KEY,
+    year INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    driver TEXT,
+    team TEXT,
+    event TEXT NOT NULL,
+    impact TEXT,
+    similarity TEXT
+);
+CREATE INDEX events_year ON events (year);
+CREATE INDEX events_type_year ON events (type, year);
+CREATE INDEX events_driver_year ON events (driver COLLATE NOCASE, year);
+CREATE INDEX events_team_year ON events (team COLLATE NOCASE, year);
+CREATE TABLE periods (
+    name TEXT PRIMARY KEY,
+    start_year INTEGER NOT NULL,
+    end_year INTEGER,
+    description TEXT NOT NULL,
+    key_events TEXT NOT NULL
+);
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class HistoricalEventStore:
+    """Indexed queries over historical events and periods in an SQLite database"""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+        # One connection is shared by every Streamlit session thread
+        self._lock = threading.Lock()
+        self._timeline = None
+        self._periods = None
+
+    def __len__(self) -> int:
+        return self._fetch("SELECT COUNT(*) FROM events", ())[0][0]
+
+    @property
+    def source_hash(self) -> Optional[str]:
+        """Hash of the JSON source the store was built from"""
+        rows = self._fetch("SELECT value FROM metadata WHERE key = 'source_hash'", ())
+        return rows[0][0] if rows else None
+
+    def timeline(self) -> List[Dict]:
+        """Every event in year order, read once and then shared, so callers must not modify it"""
+        if self._timeline is None:
+            rows = self._fetch(f"SELECT {', '.join(EVENT_COLUMNS)} FROM events ORDER BY id", ())
+            self._timeline = [_row_to_event(row) for row in rows]
+        return self._timeline
+
+    def query(self, event_type: str = None, driver: str = None, team: str = None,
+              start_year: int = None, end_year: int = None, limit: int = None) -> List[Dict]:
+        """Get copies of the events matching every given filter, in year order"""
+        # The indexes hold the row ids, which are timeline positions, so no table rows are read
+        timeline = self.timeline()
+        sql, params = self._select(event_type, driver, team, start_year, end_year, limit)
+        # Copied so a caller changing a result cannot change the shared timeline
+        return [dict(timeline[event_id]) for event_id, in self._fetch(sql, params)]
+
+    def query_plan(self, event_type: str = None, driver: str = None, team: str = None,
+                   start_year: int = None, end_year: int = None) -> List[str]:
+        """SQLite's plan for a query, to check which index serves it"""
+        sql, params = self._select(event_type, driver, team, start_year, end_year, None)
+        return [row[-1] for row in self._fetch("EXPLAIN QUERY PLAN " + sql, params)]
+
+    def events_in_decade(self, decade: int, event_type: str = None) -> List[Dict]:
+        """Get the events of a decade, such as every crash of the 1990s"""
+        start = decade - decade % 10
+        return self.query(event_type=event_type, start_year=start, end_year=start + 9)
+
+    def periods(self) -> List[Dict]:
+        """Copies of every historical period in chronological order"""
+        return [_copy_period(period) for period in self._load_periods()]
+
+    def _load_periods(self) -> List[Dict]:
+        """Read the periods once and share them"""
+        if self._periods is None:
+            rows = self._fetch("SELECT name, start_year, end_year, description, key_events FROM periods "
+                               "ORDER BY start_year", ())
+            self._periods = [{
+                "name": name,
+                "start_year": start_year,
+                "end_year": end_year,
+                "description": description,
+                "key_events": json.loads(key_events)
+            } for name, start_year, end_year, description, key_events in rows]
+        return self._periods
+
+    def period(self, name: str) -> Optional[Dict]:
+        """Get a copy of one period by name"""
+        period = next((period for period in self._load_periods() if period["name"] == name), None)
+        return _copy_period(period) if period is not None else None
+
+    def period_events(self, name: str, event_type: str = None) -> List[Dict]:
+        """Get the events that happened during a period"""
+        period = self.period(name)
+        if period is None:
+            return []
+        return self.query(event_type=event_type, start_year=period["start_year"], end_year=period["end_year"])
+
+    def _select(self, event_type: Optional[str], driver: Optional[str], team: Optional[str],
+                start_year: Optional[int], end_year: Optional[int], limit: Optional[int]) -> Tuple[str, list]:
+        """Build the SQL for a filtered event query"""
+        conditions, params = [], []
+        if event_type is not None:
+            conditions.append("type = ?")
+            params.append(event_type.lower())
+        if driver is not None:
+            conditions.append("driver = ? COLLATE NOCASE")
+            params.append(driver)
+        if team is not None:
+            conditions.append("team = ? COLLATE NOCASE")
+            params.append(team)
+        if start_year is not None:
+            conditions.append("year >= ?")
+            params.append(start_year)
+        if end_year is not None:
+            conditions.append("year <= ?")
+            params.append(end_year)
+
+        sql = "SELECT id FROM events"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY year, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return sql, params
+
+    def _fetch(self, sql: str, params) -> List[tuple]:
+        """Run a read query under the connection lock"""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+
+def _copy_period(period: Dict) -> Dict:
+    """Copy a period, including its list of key events"""
+    return dict(period, key_events=list(period["key_events"]))
+
+
+def _row_to_event(row: tuple) -> Dict:
+    """Turn an events row into an event dict, leaving out empty columns"""
+    return {column: value for column, value in zip(EVENT_COLUMNS, row) if value is not None}
+
+
+def load_historical_source(source_path: str = DEFAULT_SOURCE_PATH) -> Dict:
+    """Read the editable JSON list of events and periods"""
+    with open(source_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def populate_historical_store(connection: sqlite3.Connection, source: Dict, source_hash: Optional[str] = None):
+    """Create the schema and indexes and load the events and periods"""
+    # Stable sort, so events of the same year keep their order in the source
+    events = sorted(source.get("events", []), key=lambda event: event["year"])
+    with connection:
+        connection.executescript(SCHEMA)
+        placeholders = ", ".join("?" * (len(EVENT_COLUMNS) + 1))
+        connection.executemany(
+            f"INSERT INTO events (id, {', '.join(EVENT_COLUMNS)}) VALUES ({placeholders})",
+            ((event_id,) + tuple(event["type"].lower() if column == "type" else event.get(column)
+                                 for column in EVENT_COLUMNS)
+             for event_id, event in enumerate(events))
+        )
+        connection.executemany(
+            "INSERT INTO periods (name, start_year, end_year, description, key_events) VALUES (?, ?, ?, ?, ?)",
+            ((period["name"], period["start_year"], period.get("end_year"), period["description"],
+              json.dumps(period.get("key_events", []))) for period in source.get("periods", []))
+        )
+        connection.execute("INSERT INTO metadata (key, value) VALUES ('source_hash', ?)", (source_hash,))
+        connection.execute("ANALYZE")
+
+
+def build_historical_store(source: Dict, path: str = DEFAULT_STORE_PATH, source_hash: Optional[str] = None):
+    """Compile events and periods into an SQLite file, recording the hash of their source"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + ".tmp"
+    if os.path.exists(temporary_path):
+        os.remove(temporary_path)
+
+    connection = sqlite3.connect(temporary_path)
+    try:
+        populate_historical_store(connection, source, source_hash)
+    finally:
+        connection.close()
+    os.replace(temporary_path, path)
+
+
+def open_historical_store(path: str = DEFAULT_STORE_PATH,
+                          source_path: str = DEFAULT_SOURCE_PATH) -> HistoricalEventStore:
+    """Open the compiled store, or build one in memory when it is missing, unreadable or out of date"""
+    if os.path.exists(path):
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        store = HistoricalEventStore(connection)
+        try:
+            # Without the JSON there is nothing to rebuild from, so any readable store is used
+            if not os.path.exists(source_path) or store.source_hash == source_file_hash(source_path):
+                return store
+        except sqlite3.Error:
+            # Corrupt, or built before the metadata table existed
+            pass
+        connection.close()
+
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    populate_historical_store(connection, load_historical_source(source_path))
+    return HistoricalEventStore(connection)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_historical_store() -> HistoricalEventStore:
+    """Get the store shared by every session in the process, opening it on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = open_historical_store()
+        return _store
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compile the F1 historical event store")
+    parser.add_argument("command", choices=["build"], help="Action to run")
+    parser.add_argument("-s", "--source", default=DEFAULT_SOURCE_PATH, help="JSON file of events and periods")
+    parser.add_argument("-o", "--output", default=DEFAULT_STORE_PATH, help="Path of the compiled store")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    source = load_historical_source(args.source)
+    build_historical_store(source, args.output, source_file_hash(args.source))
+    print(f"✅ Compiled {len(source.get('events', []))} historical events into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
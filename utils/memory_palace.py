@@ -1,86 +1,40 @@
 import json
-import random
+import threading
+import weakref
 from typing import Dict, List
 
+from utils.historical_index import HistoricalEventIndex
+from utils.historical_store import HistoricalEventStore, get_historical_store
+
+# Search indexes shared by every MemoryPalace reading the same store
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
 class MemoryPalace:
     """Handles F1 historical context and memory palace functionality"""
     
-    def __init__(self):
-        self.historical_database = {
-            "crash": [
-                {
-                    "year": 1994,
-                    "driver": "Ayrton Senna",
-                    "event": "Fatal crash at Imola",
-                    "impact": "Led to major safety improvements in F1",
-                    "similarity": "High-speed crash at challenging corner"
-                },
-                {
-                    "year": 2014,
-                    "driver": "Jules Bianchi",
-                    "event": "Crash at Suzuka",
-                    "impact": "Introduction of Virtual Safety Car",
-                    "similarity": "Wet weather crash with heavy machinery"
-                }
-            ],
-            "overtake": [
-                {
-                    "year": 2008,
-                    "driver": "Lewis Hamilton",
-                    "event": "Last corner overtake in Brazil",
-                    "impact": "Won first world championship",
-                    "similarity": "Championship-deciding overtake"
-                },
-                {
-                    "year": 2019,
-                    "driver": "Max Verstappen",
-                    "event": "Overtake around the outside at Copse",
-                    "impact": "Showcased new generation talent",
-                    "similarity": "Aggressive overtaking move"
-                }
-            ],
-            "pit_stop": [
-                {
-                    "year": 2019,
-                    "team": "Red Bull Racing",
-                    "event": "1.82 second pit stop",
-                    "impact": "Fastest pit stop in F1 history",
-                    "similarity": "Ultra-fast tire change"
-                }
-            ],
-            "safety_car": [
-                {
-                    "year": 2014,
-                    "event": "Introduction of Virtual Safety Car",
-                    "impact": "Revolutionized race control",
-                    "similarity": "Safety car deployment"
-                }
-            ],
-            "weather": [
-                {
-                    "year": 2007,
-                    "event": "Fuji rain race",
-                    "impact": "One of the most chaotic wet races",
-                    "similarity": "Weather affecting race outcome"
-                }
-            ]
-        }
-        
-        self.periods = {
-            "1950s-1960s": "Golden age of F1, dangerous but exciting",
-            "1970s-1980s": "Ground effect era, turbo engines",
-            "1990s-2000s": "Electronic aids, safety improvements",
-            "2010s-Present": "Hybrid era, advanced aerodynamics"
-        }
+    def __init__(self, store: HistoricalEventStore = None):
+        # Events and periods live in assets/historical_events.json, compiled by utils/historical_store.py
+        self.store = store or get_historical_store()
+        self.periods = {period["name"]: period["description"] for period in self.store.periods()}
+        self._timeline = None
+    
+    @property
+    def index(self) -> HistoricalEventIndex:
+        """Search index over every historical event, built once per store"""
+        with _indexes_lock:
+            index = _indexes.get(self.store)
+            if index is None:
+                index = _indexes[self.store] = HistoricalEventIndex(self.store.timeline())
+            return index
     
     def get_historical_context(self, current_event: str) -> Dict:
         """Get historical context for a current race event"""
         # Find the most relevant historical event
-        event_key = self._categorize_event(current_event)
+        matches = self.find_similar_events(current_event, k=1)
         
-        if event_key in self.historical_database:
-            historical_events = self.historical_database[event_key]
-            selected_event = random.choice(historical_events)
+        if matches:
+            selected_event = matches[0]
         else:
             # Default historical event
             selected_event = {
@@ -99,22 +53,15 @@ class MemoryPalace:
             "similarity": selected_event["similarity"]
         }
     
-    def _categorize_event(self, event: str) -> str:
-        """Categorize current event to find relevant historical context"""
-        event_lower = event.lower()
-        
-        if any(word in event_lower for word in ["crash", "accident", "collision"]):
-            return "crash"
-        elif any(word in event_lower for word in ["overtake", "pass", "overtaking"]):
-            return "overtake"
-        elif any(word in event_lower for word in ["pit", "stop", "tire"]):
-            return "pit_stop"
-        elif any(word in event_lower for word in ["safety", "car"]):
-            return "safety_car"
-        elif any(word in event_lower for word in ["weather", "rain", "wet"]):
-            return "weather"
-        else:
-            return "general"
+    def find_similar_events(self, current_event: str, k: int = 3) -> List[Dict]:
+        """Get the k historical events most similar to a current race event, best first"""
+        return [dict(event, score=round(score, 3)) for event, score in self.index.search(current_event, k)]
+    
+    def find_events(self, event_type: str = None, driver: str = None, team: str = None,
+                    start_year: int = None, end_year: int = None) -> List[Dict]:
+        """Get historical events by type, driver, team and year range, in year order"""
+        return self.store.query(event_type=event_type, driver=driver, team=team,
+                                start_year=start_year, end_year=end_year)
     
     def get_period_context(self, period: str) -> Dict:
         """Get context for a specific historical period"""
@@ -126,35 +73,27 @@ class MemoryPalace:
     
     def _get_period_events(self, period: str) -> List[str]:
         """Get key events for a specific period"""
-        period_events = {
-            "1950s-1960s": ["First F1 championship", "Fangio's dominance", "British teams rise"],
-            "1970s-1980s": ["Ground effect cars", "Turbo era", "Safety improvements"],
-            "1990s-2000s": ["Schumacher era", "Electronic aids", "Global expansion"],
-            "2010s-Present": ["Hybrid engines", "Hamilton dominance", "New regulations"]
-        }
+        period_info = self.store.period(period)
         
-        return period_events.get(period, ["Significant F1 developments"])
+        return period_info["key_events"] if period_info else ["Significant F1 developments"]
+    
+    def get_period_events(self, period: str, event_type: str = None) -> List[Dict]:
+        """Get the historical events that happened during a period"""
+        return self.store.period_events(period, event_type)
     
     def create_memory_timeline(self) -> Dict:
         """Create a timeline of F1 historical events"""
-        timeline = []
-        
-        for event_type, events in self.historical_database.items():
-            for event in events:
-                timeline.append({
-                    "year": event["year"],
-                    "type": event_type,
-                    "event": event["event"],
-                    "impact": event["impact"]
-                })
-        
-        # Sort by year
-        timeline.sort(key=lambda x: x["year"])
+        if self._timeline is None:
+            # The store's events are already in year order
+            self._timeline = [{
+                "year": event["year"],
+                "type": event["type"],
+                "event": event["event"],
+                "impact": event["impact"]
+            } for event in self.store.timeline()]
         
         return {
-            "timeline": timeline,
-            "total_events": len(timeline),
+            "timeline": self._timeline,
+            "total_events": len(self._timeline),
             "periods_covered": list(self.periods.keys())
         }
-
-
@@ -1,5 +1,20 @@
 import random
-from typing import Dict, List
+import re
+from collections import deque
+from typing import Dict, List, Optional, Union
+
+from utils.phrase_matcher import PhraseMatcher
+from utils.translation import get_translation_engine
+from utils.translation_cache import TranslationCache
+
+# Shared across instances, since Streamlit creates a new one on every rerun
+_result_cache = TranslationCache()
+
+
+def configure_commentary_cache(maxsize: int, ttl: Optional[float] = None):
+    """Resize the shared translate_and_simplify cache and set its TTL in seconds"""
+    _result_cache.resize(maxsize, ttl)
+
 
 class MultilingualCommentary:
     """Handles multilingual commentary translation and simplification"""
@@ -69,14 +84,28 @@ class MultilingualCommentary:
                 "race strategy": "race plan"
             }
         }
+        
+        # Compile all simplification rules into a single-pass matcher
+        self._simplifier = PhraseMatcher({
+            **self.simplification_rules["technical_terms"],
+            **self.simplification_rules["complex_phrases"],
+            # Simplify sentence structure
+            "LAP": "Lap",
+            "P1": "1st place",
+            "P2": "2nd place"
+        })
     
     def translate_and_simplify(self, commentary: str, target_language: str) -> Dict:
         """Translate commentary and create simplified version"""
-        # Simulate translation (in real implementation, would use translation API)
-        translated = self._simulate_translation(commentary, target_language)
-        
-        # Create simplified version
-        simplified = self._simplify_commentary(commentary)
+        translated, simplified = _result_cache.get_or_compute(
+            commentary, target_language,
+            lambda text: (
+                # Simulate translation (in real implementation, would use translation API)
+                self._simulate_translation(text, target_language),
+                # Create simplified version
+                self._simplify_commentary(text)
+            )
+        )
         
         return {
             "translation": translated,
@@ -109,22 +138,7 @@ class MultilingualCommentary:
     
     def _simplify_commentary(self, commentary: str) -> str:
         """Simplify commentary for easier understanding"""
-        simplified = commentary
-        
-        # Replace technical terms
-        for technical, simple in self.simplification_rules["technical_terms"].items():
-            simplified = simplified.replace(technical, simple)
-        
-        # Replace complex phrases
-        for complex_phrase, simple_phrase in self.simplification_rules["complex_phrases"].items():
-            simplified = simplified.replace(complex_phrase, simple_phrase)
-        
-        # Simplify sentence structure
-        simplified = simplified.replace("LAP", "Lap")
-        simplified = simplified.replace("P1", "1st place")
-        simplified = simplified.replace("P2", "2nd place")
-        
-        return simplified
+        return self._simplifier.replace(commentary)
     
     def generate_summary(self, commentary: str) -> str:
         """Generate a summary of the commentary"""
@@ -157,17 +171,178 @@ class MultilingualCommentary:
         else:
             return self._simulate_translation(phrase, target_language)
     
+    def get_cache_stats(self) -> Dict:
+        """Get hit, miss and eviction counters for the translation cache"""
+        return _result_cache.stats()
+    
+    def clear_cache(self):
+        """Empty the translation cache and reset its counters"""
+        _result_cache.clear()
+    
+    def configure_cache(self, maxsize: int, ttl: Optional[float] = None):
+        """Resize the translation cache and set its TTL in seconds"""
+        configure_commentary_cache(maxsize, ttl)
+    
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages"""
         return list(self.language_codes.keys())
     
     def create_language_comparison(self, text: str) -> Dict:
         """Create comparison of text in multiple languages"""
-        comparison = {}
+        engine = get_translation_engine()
+        languages = [language for language in self.language_codes if engine.has_dictionary(language)]
+        # One batch call tokenizes the text once for every language with a dictionary
+        translated = dict(zip(languages, engine.translate_batch([text], languages)[0]))
         
+        comparison = {}
         for language in self.language_codes.keys():
-            comparison[language] = self._simulate_translation(text, language)
+            if language in translated:
+                comparison[language] = translated[language]
+            else:
+                comparison[language] = self._simulate_translation(text, language)
         
         return comparison
 
 
+# One to three capitalized words, e.g. "Max Verstappen" or "HAMILTON"
+_DRIVER = r"((?:[A-Z][\w'-]+ ){0,2}[A-Z][\w'-]+)"
+_SECONDS = r"(\d+(?:\.\d+)?) ?(?:seconds|secs|s)\b"
+
+class LiveCommentarySummarizer:
+    """Incrementally summarizes live commentary, one event at a time
+    
+    Each event updates a running race state (lap, leader, positions, gaps
+    and pit stops) in constant time, so a summary can be taken at any
+    moment without rescanning the commentary history.
+    """
+    
+    lap_pattern = re.compile(r"\bLAP (\d+)", re.IGNORECASE)
+    leader_pattern = re.compile(_DRIVER + r" leads(?: by " + _SECONDS + ")?")
+    position_pattern = re.compile(_DRIVER + r",? (?:in|to|is|rejoins in) P(\d+)\b")
+    rejoin_pattern = re.compile(_DRIVER + r" (?:enters the pits|pits|boxes)\b[^.!?]*? rejoins in P(\d+)\b")
+    overtake_pattern = re.compile(_DRIVER + r" overtakes " + _DRIVER)
+    pit_pattern = re.compile(_DRIVER + r" (?:enters the pits|pits|boxes)\b")
+    gap_pattern = re.compile(_DRIVER + r" is closing the gap to " + _DRIVER + r".*?" + _SECONDS)
+    
+    def __init__(self, recent_pit_stops: int = 5):
+        self.current_lap = None
+        self.leader = None
+        self.leader_gap = None
+        self.positions = {}
+        self.gaps = {}
+        self.pit_stops = 0
+        self.recent_pit_stops = deque(maxlen=recent_pit_stops)
+        self.events_seen = 0
+        self.last_timestamp = None
+    
+    def consume(self, event: Union[str, Dict]):
+        """Update the race state with one commentary event"""
+        if isinstance(event, dict):
+            text = event.get("text", "")
+            self.last_timestamp = event.get("ts", self.last_timestamp)
+        else:
+            text = event
+        self.events_seen += 1
+        
+        lap_match = self.lap_pattern.search(text)
+        if lap_match:
+            self.current_lap = int(lap_match.group(1))
+        
+        for driver, position in self.position_pattern.findall(text):
+            self._set_position(driver, int(position))
+        
+        for driver, position in self.rejoin_pattern.findall(text):
+            self._set_position(driver, int(position))
+        
+        leader_match = self.leader_pattern.search(text)
+        if leader_match:
+            self._set_position(leader_match.group(1), 1)
+            self.leader_gap = float(leader_match.group(2)) if leader_match.group(2) else None
+        
+        overtake_match = self.overtake_pattern.search(text)
+        if overtake_match:
+            self._record_overtake(*overtake_match.groups())
+        
+        gap_match = self.gap_pattern.search(text)
+        if gap_match:
+            self.gaps[gap_match.group(1)] = (gap_match.group(2), float(gap_match.group(3)))
+        
+        pit_match = self.pit_pattern.search(text)
+        if pit_match:
+            self.pit_stops += 1
+            self.recent_pit_stops.append({"driver": pit_match.group(1), "lap": self.current_lap})
+    
+    def _set_position(self, driver: str, position: int):
+        """Place a driver at a position, moving the drivers in between along a place"""
+        current_position = self._position_of(driver)
+        if current_position != position:
+            if current_position is not None:
+                del self.positions[current_position]
+            if position in self.positions:
+                # Drivers move up when the driver drops back, and back otherwise, until a free slot
+                step = -1 if current_position is not None and current_position < position else 1
+                slot = position
+                moving = self.positions.pop(slot)
+                while moving is not None:
+                    slot += step
+                    moving, self.positions[slot] = self.positions.get(slot), moving
+            self.positions[position] = driver
+        
+        # The leader is whoever holds P1, so losing it also drops the old leader's gap
+        leader = self.positions.get(1)
+        if leader != self.leader:
+            self.leader = leader
+            self.leader_gap = None
+    
+    def _position_of(self, driver: str) -> Optional[int]:
+        """Get the position a driver holds in the table, if any"""
+        return next((position for position, held in self.positions.items() if held == driver), None)
+    
+    def _record_overtake(self, driver: str, overtaken: str):
+        """Put a driver ahead of the one they passed, moving everyone in between back a place"""
+        overtaken_position = self._position_of(overtaken)
+        if overtaken_position is None:
+            return
+        
+        driver_position = self._position_of(driver)
+        if driver_position is not None and driver_position < overtaken_position:
+            # Already ahead in the table
+            return
+        self._set_position(driver, overtaken_position)
+    
+    def snapshot(self) -> Dict:
+        """Get the current race state and a summary of it"""
+        return {
+            "lap": self.current_lap,
+            "leader": self.leader,
+            "leader_gap": self.leader_gap,
+            "positions": dict(sorted(self.positions.items())),
+            "gaps": {driver: {"to": ahead, "seconds": seconds} for driver, (ahead, seconds) in self.gaps.items()},
+            "pit_stops": self.pit_stops,
+            "recent_pit_stops": list(self.recent_pit_stops),
+            "events_seen": self.events_seen,
+            "timestamp": self.last_timestamp,
+            "summary": self.summary()
+        }
+    
+    def summary(self) -> str:
+        """Summarize the race so far in one or two sentences"""
+        summary_parts = []
+        
+        if self.current_lap is not None:
+            summary_parts.append(f"At LAP {self.current_lap}")
+        
+        if self.leader:
+            gap = f" by {self.leader_gap:g} seconds" if self.leader_gap is not None else ""
+            summary_parts.append(f"{self.leader} is leading{gap}")
+        
+        if self.positions:
+            top_three = sorted(self.positions.items())[:3]
+            summary_parts.append(f"Positions: {', '.join(f'P{p} {d}' for p, d in top_three)}")
+        
+        if self.pit_stops:
+            last_stop = self.recent_pit_stops[-1]
+            lap = f" on LAP {last_stop['lap']}" if last_stop["lap"] is not None else ""
+            summary_parts.append(f"Pit stops: {self.pit_stops} (last: {last_stop['driver']}{lap})")
+        
+        return ". ".join(summary_parts) + "." if summary_parts else "No race updates yet."
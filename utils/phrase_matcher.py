@@ -0,0 +1,57 @@
+import re
+from typing import Dict, Iterable
+
+
+class PhraseMatcher:
+    """Rewrites every phrase from a replacement table in one left-to-right scan
+
+    The phrases are folded into a character trie which is compiled into a
+    single regular expression, so matching cost depends on the text length
+    rather than the number of phrases. Where several phrases start at the
+    same position the longest one wins.
+    """
+
+    def __init__(self, replacements: Dict[str, str]):
+        self.replacements = {phrase: replacement for phrase, replacement in replacements.items() if phrase}
+        self._pattern = re.compile(build_trie_pattern(self.replacements)) if self.replacements else None
+
+    def replace(self, text: str) -> str:
+        """Replace all phrases found in the text"""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._lookup, text)
+
+    def contains_phrase(self, text: str) -> bool:
+        """Check whether any phrase occurs in the text"""
+        return self._pattern is not None and self._pattern.search(text) is not None
+
+    def _lookup(self, match: "re.Match") -> str:
+        """Get the replacement for a matched phrase"""
+        return self.replacements[match.group(0)]
+
+
+def build_trie_pattern(phrases: Iterable[str]) -> str:
+    """Build a regex source matching any of the phrases, preferring the longest"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+    return _trie_to_pattern(trie)
+
+
+def _trie_to_pattern(node: Dict) -> str:
+    """Convert a trie node into a regex that prefers the longest phrase"""
+    is_end = "" in node
+    branches = [re.escape(char) + _trie_to_pattern(child)
+                for char, child in sorted(node.items()) if char != ""]
+
+    if not branches:
+        return ""
+    if len(branches) == 1 and not is_end:
+        return branches[0]
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    # Greedy optional group: try the longer phrases before stopping here
+    return pattern + "?" if is_end else pattern
@@ -0,0 +1,101 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Sequence, Tuple
+
+import imageio
+import numpy as np
+from PIL import Image, ImageSequence
+
+PLACEHOLDER_ANIMATION = "assets/combined_sign_animation.gif"
+
+
+class SignAnimationComposer:
+    """Concatenates per-sign GIF clips into one animation
+
+    Results are cached on disk under a name derived from the sign-ID
+    sequence, so a sequence is only ever encoded once. Decoded clips are
+    kept in an in-memory LRU, so frames of common signs are reused across
+    requests, and output frames are streamed to the GIF encoder one at a
+    time instead of being collected in memory first.
+    """
+
+    def __init__(self, cache_dir: str = "assets/sign_cache", clip_cache_size: int = 32,
+                 frame_size: Tuple[int, int] = (240, 240), frame_duration: float = 0.1):
+        self.cache_dir = cache_dir
+        self.clip_cache_size = clip_cache_size
+        self.frame_size = frame_size
+        self.frame_duration = frame_duration
+        self._clips = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compose(self, sign_ids: Sequence[int], clip_paths: Sequence[str]) -> str:
+        """Get the path of the combined animation for a sequence of signs"""
+        available = [(sign_id, path) for sign_id, path in zip(sign_ids, clip_paths) if os.path.exists(path)]
+        if not available:
+            return PLACEHOLDER_ANIMATION
+
+        cache_key = self.cache_key(available)
+        output_path = os.path.join(self.cache_dir, cache_key + ".gif")
+        if os.path.exists(output_path):
+            return output_path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a unique temporary file so concurrent requests never see a partial GIF
+        temporary_path = os.path.join(self.cache_dir, f"{cache_key}.{os.getpid()}.{threading.get_ident()}.tmp.gif")
+        with imageio.get_writer(temporary_path, format="GIF-PIL", mode="I",
+                                duration=self.frame_duration, loop=0) as writer:
+            for _, path in available:
+                for frame in self._get_clip(path):
+                    writer.append_data(frame)
+        os.replace(temporary_path, output_path)
+
+        return output_path
+
+    def cache_key(self, signs: Sequence[Tuple[int, str]]) -> str:
+        """Content address of a sign sequence and the render settings"""
+        digest = hashlib.sha256()
+        digest.update(f"{self.frame_size}|{self.frame_duration}".encode("utf-8"))
+        for sign_id, path in signs:
+            digest.update(f"|{sign_id}:{path}".encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def _get_clip(self, path: str) -> Tuple[np.ndarray, ...]:
+        """Get the decoded frames of a clip, decoding it on first use"""
+        with self._lock:
+            frames = self._clips.get(path)
+            if frames is not None:
+                self._clips.move_to_end(path)
+                return frames
+
+        frames = self._decode_clip(path)
+
+        with self._lock:
+            self._clips[path] = frames
+            self._clips.move_to_end(path)
+            while len(self._clips) > self.clip_cache_size:
+                self._clips.popitem(last=False)
+        return frames
+
+    def _decode_clip(self, path: str) -> Tuple[np.ndarray, ...]:
+        """Decode every frame of a clip as RGB at the output frame size"""
+        frames = []
+        with Image.open(path) as clip:
+            for frame in ImageSequence.Iterator(clip):
+                frame = frame.convert("RGB")
+                if frame.size != self.frame_size:
+                    frame = frame.resize(self.frame_size)
+                frames.append(np.asarray(frame))
+        return tuple(frames)
+
+
+_composer = None
+
+
+def get_sign_animation_composer() -> SignAnimationComposer:
+    """Get the shared composer, so its clip cache survives Streamlit reruns"""
+    global _composer
+    if _composer is None:
+        _composer = SignAnimationComposer()
+    return _composer
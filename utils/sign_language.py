@@ -1,6 +1,96 @@
 import random
 import json
-from typing import Dict, List
+import os
+import re
+from array import array
+from typing import Dict, List, Tuple
+
+class SignGlossEngine:
+    """Converts commentary into a sequence of sign IDs
+    
+    The text is tokenized once, each token is normalized (punctuation
+    removed, simple plural and verb endings stemmed) and the tokens are
+    matched against a word trie built from the sign vocabulary, so
+    multi-word signs such as "safety car" are found with longest-match
+    semantics in a single pass.
+    """
+    
+    token_pattern = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+    
+    def __init__(self, vocabulary: List[str]):
+        self.vocabulary = list(vocabulary)
+        self.sign_ids = {sign: sign_id for sign_id, sign in enumerate(self.vocabulary)}
+        
+        # Word trie over the vocabulary, None marks the sign ID of a complete phrase
+        self.trie = {}
+        self.known_words = set()
+        for sign_id, sign in enumerate(self.vocabulary):
+            node = self.trie
+            for word in self.token_pattern.findall(sign.lower()):
+                self.known_words.add(word)
+                node = node.setdefault(word, {})
+            node[None] = sign_id
+        
+        self._normalized = {}
+    
+    def gloss(self, commentary: str) -> array:
+        """Get the sign IDs for a piece of commentary"""
+        tokens = [self.normalize(token) for token in self.token_pattern.findall(commentary.lower())]
+        sign_ids = array("I")
+        
+        position = 0
+        while position < len(tokens):
+            node = self.trie
+            match_id, match_end = None, position
+            for end in range(position, len(tokens)):
+                node = node.get(tokens[end])
+                if node is None:
+                    break
+                if None in node:
+                    match_id, match_end = node[None], end + 1
+            
+            if match_id is None:
+                position += 1
+            else:
+                sign_ids.append(match_id)
+                position = match_end
+        
+        return sign_ids
+    
+    def normalize(self, token: str) -> str:
+        """Reduce a token to a vocabulary word where a simple stem matches"""
+        normalized = self._normalized.get(token)
+        if normalized is None:
+            normalized = next((word for word in self._stems(token) if word in self.known_words), token)
+            # Bound the memo on unusual input streams
+            if len(self._normalized) > 50000:
+                self._normalized.clear()
+            self._normalized[token] = normalized
+        return normalized
+    
+    @staticmethod
+    def _stems(token: str) -> List[str]:
+        """Candidate stems of a token, most specific first"""
+        if token.endswith("'s"):
+            token = token[:-2]
+        stems = [token]
+        
+        if token.endswith("ies"):
+            stems.append(token[:-3] + "y")
+        if token.endswith("es"):
+            stems.append(token[:-2])
+        if token.endswith("s") and not token.endswith("ss"):
+            stems.append(token[:-1])
+        
+        for suffix in ("ing", "ed"):
+            if token.endswith(suffix) and len(token) > len(suffix) + 2:
+                base = token[:-len(suffix)]
+                stems.extend([base, base + "e"])
+                # Doubled consonants, e.g. "winning" or "stopped"
+                if base[-1] == base[-2]:
+                    stems.append(base[:-1])
+        
+        return stems
 
 class SignLanguageAvatar:
     """Handles sign language avatar functionality for F1 commentary"""
@@ -16,7 +106,9 @@ class SignLanguageAvatar:
             "safety": "assets/sign_safety.gif",
             "car": "assets/sign_car.gif",
             "race": "assets/sign_race.gif",
-            "fast": "assets/sign_fast.gif"
+            "fast": "assets/sign_fast.gif",
+            "safety car": "assets/sign_safety_car.gif",
+            "pit stop": "assets/sign_pit_stop.gif"
         }
         
         self.gesture_mapping = {
@@ -29,22 +121,23 @@ class SignLanguageAvatar:
             "safety": "Hands forming safety symbol",
             "car": "Steering wheel motion",
             "race": "Running motion",
-            "fast": "Quick hand movements"
+            "fast": "Quick hand movements",
+            "safety car": "Safety symbol followed by slow steering wheel motion",
+            "pit stop": "Circular motion ending with a flat palm stop"
         }
+        
+        self.gloss_engine = SignGlossEngine(list(self.sign_database))
     
     def generate_sign_language(self, commentary: str) -> Dict:
         """Generate sign language animation for commentary"""
-        words = commentary.lower().split()
-        detected_words = []
-        
-        for word in words:
-            if word in self.sign_database:
-                detected_words.append(word)
+        sign_ids = self.gloss_engine.gloss(commentary)
+        detected_words = [self.gloss_engine.vocabulary[sign_id] for sign_id in sign_ids]
         
         return {
+            "sign_ids": list(sign_ids),
             "detected_words": detected_words,
             "animation_sequence": [self.sign_database[word] for word in detected_words],
-            "gesture_descriptions": [self.gesture_mapping[word] for word in detected_words]
+            "gesture_descriptions": [self.get_word_mapping(word) for word in detected_words]
         }
     
     def get_word_mapping(self, word: str) -> str:
@@ -53,7 +146,28 @@ class SignLanguageAvatar:
     
     def create_avatar_animation(self, words: List[str]) -> str:
         """Create a combined animation for multiple words"""
-        # This would combine multiple sign language animations
-        return "assets/combined_sign_animation.gif"
+        # Imported here so glossing does not require the image libraries
+        from utils.sign_animation import get_sign_animation_composer
+        
+        sign_ids, clip_paths = self._clip_sequence(self.gloss_engine.gloss(" ".join(words)))
+        return get_sign_animation_composer().compose(sign_ids, clip_paths)
+    
+    def _clip_sequence(self, sign_ids: List[int]) -> Tuple[List[int], List[str]]:
+        """Get the clips for a sign sequence, signing a phrase word by word when it has no clip of its own"""
+        clip_ids, clip_paths = [], []
+        for sign_id in sign_ids:
+            sign = self.gloss_engine.vocabulary[sign_id]
+            path = self.sign_database[sign]
+            if os.path.exists(path) or " " not in sign:
+                clip_ids.append(sign_id)
+                clip_paths.append(path)
+                continue
+            
+            for word in sign.split():
+                word_id = self.gloss_engine.sign_ids.get(word)
+                if word_id is not None:
+                    clip_ids.append(word_id)
+                    clip_paths.append(self.sign_database[word])
+        return clip_ids, clip_paths
 
 
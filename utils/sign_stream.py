@@ -0,0 +1,166 @@
+"""
+Live sign language streaming for race commentary.
+
+Commentary events are pushed onto an asyncio queue and a single consumer
+turns each one into a timed sequence of signs, paced at the speed the
+avatar can sign them. When the avatar falls more than a latency budget
+behind live, stale events that have already been superseded are dropped
+and the newest one is compressed (repeated signs removed, the sequence
+shortened and signed faster), so the output catches back up instead of
+drifting further behind.
+
+Usage:
+    stream = SignLanguageStream(latency_budget=2.0)
+    consumer = asyncio.create_task(stream.run(on_segment=print))
+    await stream.publish({"text": "Hamilton overtakes Verstappen", "timestamp": time.time()})
+    await stream.close()
+    await consumer
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from utils.sign_language import SignLanguageAvatar
+
+
+class SignLanguageStream:
+    """Asyncio consumer turning commentary events into timestamped sign sequences"""
+
+    def __init__(self, avatar: SignLanguageAvatar = None, latency_budget: float = 2.0,
+                 sign_duration: float = 0.6, compressed_sign_limit: int = 3,
+                 compressed_speedup: float = 1.5, clock: Callable[[], float] = time.time,
+                 latency_window: int = 1000):
+        self.avatar = avatar or SignLanguageAvatar()
+        self.latency_budget = latency_budget
+        self.sign_duration = sign_duration
+        self.compressed_sign_limit = compressed_sign_limit
+        self.compressed_speedup = compressed_speedup
+        self.clock = clock
+        self.queue = asyncio.Queue()
+        # Commentary events waiting in the queue, not counting the close() sentinel
+        self._pending = 0
+
+        self._latencies = deque(maxlen=latency_window)
+        self._max_queue_depth = 0
+        self._counts = {"received": 0, "emitted": 0, "compressed": 0, "dropped": 0, "empty": 0,
+                        "signs_emitted": 0, "signs_dropped": 0}
+
+    async def publish(self, event: Dict):
+        """Add a commentary event to the stream, stamping it if needed"""
+        if "timestamp" not in event:
+            event = {**event, "timestamp": self.clock()}
+        self._counts["received"] += 1
+        self._pending += 1
+        await self.queue.put(event)
+        self._max_queue_depth = max(self._max_queue_depth, self._pending)
+
+    async def close(self):
+        """Signal the consumer to stop once the queued events are handled"""
+        await self.queue.put(None)
+
+    async def run(self, on_segment: Callable[[Dict], None] = None) -> int:
+        """Consume events until closed, returning how many segments were emitted"""
+        emitted = 0
+        async for segment in self.segments():
+            if on_segment is not None:
+                on_segment(segment)
+            emitted += 1
+        return emitted
+
+    async def segments(self) -> AsyncIterator[Dict]:
+        """Yield one sign segment per event, paced at signing speed"""
+        while True:
+            event = await self.queue.get()
+            if event is None:
+                return
+            self._pending -= 1
+
+            segment = self._build_segment(event)
+            if segment is None:
+                continue
+
+            yield segment
+            # The avatar is busy until the segment has been signed
+            await asyncio.sleep(segment["end"] - segment["start"])
+
+    def _build_segment(self, event: Dict) -> Optional[Dict]:
+        """Gloss an event and apply the latency policy"""
+        now = self.clock()
+        lag = now - event["timestamp"]
+        sign_ids = list(self.avatar.gloss_engine.gloss(event.get("text", "")))
+
+        compressed = False
+        if lag > self.latency_budget:
+            if self._pending:
+                # Stale and already superseded by newer commentary
+                self._counts["dropped"] += 1
+                self._counts["signs_dropped"] += len(sign_ids)
+                return None
+
+            compressed_ids = self.compress(sign_ids)
+            self._counts["signs_dropped"] += len(sign_ids) - len(compressed_ids)
+            sign_ids, compressed = compressed_ids, True
+
+        if not sign_ids:
+            # Handled, but there is nothing to sign
+            self._latencies.append(lag)
+            self._counts["empty"] += 1
+            return None
+
+        duration = self.sign_duration / self.compressed_speedup if compressed else self.sign_duration
+        vocabulary = self.avatar.gloss_engine.vocabulary
+        signs = [{
+            "sign_id": sign_id,
+            "word": vocabulary[sign_id],
+            "animation": self.avatar.sign_database[vocabulary[sign_id]],
+            "timestamp": now + index * duration
+        } for index, sign_id in enumerate(sign_ids)]
+
+        self._latencies.append(lag)
+        self._counts["emitted"] += 1
+        self._counts["signs_emitted"] += len(signs)
+        if compressed:
+            self._counts["compressed"] += 1
+
+        return {
+            "event_timestamp": event["timestamp"],
+            "start": now,
+            "end": now + len(signs) * duration,
+            "latency": lag,
+            "compressed": compressed,
+            "signs": signs
+        }
+
+    def compress(self, sign_ids: List[int]) -> List[int]:
+        """Shorten a sign sequence, keeping the first occurrence of each sign"""
+        return list(dict.fromkeys(sign_ids))[:self.compressed_sign_limit]
+
+    def metrics(self) -> Dict:
+        """Get queue depth, latency and drop counters"""
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+        return {
+            **self._counts,
+            "queue_depth": self._pending,
+            "max_queue_depth": self._max_queue_depth,
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "latency_max": latencies[-1] if latencies else 0.0
+        }
+
+
+async def simulate_commentary_feed(stream: SignLanguageStream, lines: Iterable[str],
+                                   interval: float, close: bool = True):
+    """Publish commentary lines into a stream at a fixed rate, like a live feed"""
+    for line in lines:
+        await stream.publish({"text": line})
+        await asyncio.sleep(interval)
+    if close:
+        await stream.close()
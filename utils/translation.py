@@ -1,6 +1,13 @@
 # Comprehensive F1 Translation Dictionary
 # This file contains extensive translation patterns for F1 commentary
 
+import re
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from utils.phrase_matcher import PhraseMatcher, build_trie_pattern
+from utils.translation_cache import TranslationCache, normalize_text
+from utils.translation_store import DEFAULT_STORE_PATH, open_translation_store
+
 def get_comprehensive_translation_dict():
     """Get comprehensive translation dictionary for F1 terms"""
     return {
@@ -270,99 +277,329 @@ def get_comprehensive_translation_dict():
         }
     }
 
-def translate_text_comprehensive(text, target_language):
-    """Comprehensive translation function with extensive word coverage"""
-    import random
-    
-    # Get comprehensive translation dictionary
-    f1_patterns = get_comprehensive_translation_dict()
-    
-    if target_language == "Simplified":
-        # Simplify the text
-        simplified = text
-        # Replace complex terms with simpler ones
-        replacements = {
-            "LAP": "Lap",
-            "leads by": "is first",
-            "closing the gap": "chasing",
-            "pits for": "stops for",
-            "fresh tires": "new tires",
-            "enters the pits": "stops",
-            "overtakes": "passes",
-            "championship": "title",
-            "qualifying": "qualifying",
-            "grid position": "starting position",
-            "fastest lap": "best lap",
-            "safety car": "safety car",
-            "red flag": "red flag",
-            "yellow flag": "yellow flag",
-            "blue flag": "blue flag"
-        }
-        
-        for complex_term, simple_term in replacements.items():
-            simplified = simplified.replace(complex_term, simple_term)
-        
-        return simplified
-    
-    # Get translation patterns for the target language
-    patterns = f1_patterns.get(target_language, {})
-    
-    # Enhanced translation with phrase patterns
-    phrase_patterns = {
-        "Spanish": {
-            "leads by": "lidera por",
-            "closing the gap": "cerrando la brecha",
-            "pits for": "entra a boxes por",
-            "fresh tires": "neumáticos nuevos",
-            "enters the pits": "entra a boxes",
-            "overtakes": "adelanta a",
-            "at turn": "en la curva",
-            "due to": "debido a",
-            "safety car": "coche de seguridad",
-            "red flag": "bandera roja",
-            "yellow flag": "bandera amarilla"
-        },
-        "French": {
-            "leads by": "mène de",
-            "closing the gap": "réduit l'écart",
-            "pits for": "s'arrête pour",
-            "fresh tires": "nouveaux pneus",
-            "enters the pits": "entre aux stands",
-            "overtakes": "dépasse",
-            "at turn": "au virage",
-            "due to": "à cause de",
-            "safety car": "voiture de sécurité",
-            "red flag": "drapeau rouge",
-            "yellow flag": "drapeau jaune"
-        }
+# Simplified English replacements for complex F1 terms
+SIMPLIFIED_REPLACEMENTS = {
+    "LAP": "Lap",
+    "leads by": "is first",
+    "closing the gap": "chasing",
+    "pits for": "stops for",
+    "fresh tires": "new tires",
+    "enters the pits": "stops",
+    "overtakes": "passes",
+    "championship": "title",
+    "qualifying": "qualifying",
+    "grid position": "starting position",
+    "fastest lap": "best lap",
+    "safety car": "safety car",
+    "red flag": "red flag",
+    "yellow flag": "yellow flag",
+    "blue flag": "blue flag"
+}
+
+# Multi-word phrases translated before individual words
+PHRASE_PATTERNS = {
+    "Spanish": {
+        "leads by": "lidera por",
+        "closing the gap": "cerrando la brecha",
+        "pits for": "entra a boxes por",
+        "fresh tires": "neumáticos nuevos",
+        "enters the pits": "entra a boxes",
+        "overtakes": "adelanta a",
+        "at turn": "en la curva",
+        "due to": "debido a",
+        "safety car": "coche de seguridad",
+        "red flag": "bandera roja",
+        "yellow flag": "bandera amarilla"
+    },
+    "French": {
+        "leads by": "mène de",
+        "closing the gap": "réduit l'écart",
+        "pits for": "s'arrête pour",
+        "fresh tires": "nouveaux pneus",
+        "enters the pits": "entre aux stands",
+        "overtakes": "dépasse",
+        "at turn": "au virage",
+        "due to": "à cause de",
+        "safety car": "voiture de sécurité",
+        "red flag": "drapeau rouge",
+        "yellow flag": "drapeau jaune"
     }
-    
-    # First, translate phrases
-    translated_text = text
-    phrases = phrase_patterns.get(target_language, {})
-    
-    for english_phrase, translated_phrase in phrases.items():
-        translated_text = translated_text.replace(english_phrase, translated_phrase)
-    
-    # Then translate individual words
-    words = translated_text.split()
-    translated_words = []
-    
-    for word in words:
-        # Clean word (remove punctuation for lookup)
-        clean_word = word.strip(".,!?;:")
-        if clean_word.upper() in patterns:
-            translated_word = patterns[clean_word.upper()]
-            # Preserve original case and punctuation
-            if word.isupper():
-                translated_words.append(translated_word.upper())
-            elif word.istitle():
-                translated_words.append(translated_word.title())
+}
+
+
+# Punctuation split off words before dictionary lookup
+WORD_PUNCTUATION = ".,!?;:"
+
+# Case shapes, used as indexes into the precomputed translation forms
+UPPER, TITLE, LOWER = 0, 1, 2
+
+
+def case_shape(word: str) -> int:
+    """Classify a word as upper case, title case or anything else"""
+    if word.isupper():
+        return UPPER
+    if word.istitle():
+        return TITLE
+    return LOWER
+
+
+def lookup_words(translations: Mapping[str, str]) -> Iterator[str]:
+    """Get the dictionary words that a single word of text can be translated by"""
+    # Words are looked up by their upper case form, so only upper case entries can match
+    return (english for english in translations
+            if english == english.upper() and english.split() == [english.strip(WORD_PUNCTUATION)])
+
+
+def word_pattern_source(translations: Mapping[str, str]) -> str:
+    """Build the regex source matching every dictionary word that can be looked up"""
+    return build_trie_pattern(lookup_words(translations))
+
+
+def compile_word_pattern(pattern_source: str) -> Optional["re.Pattern"]:
+    """Compile a word pattern source into a regex matching whole words with their punctuation"""
+    if not pattern_source:
+        return None
+    punctuation = "[" + re.escape(WORD_PUNCTUATION) + "]*"
+    return re.compile(
+        r"(?<!\S)(" + punctuation + ")(" + pattern_source + ")(" + punctuation + r")(?!\S)",
+        re.IGNORECASE
+    )
+
+
+def find_word_spans(pattern: Optional["re.Pattern"], text: str) -> List[Tuple[int, int, str, str, int, str]]:
+    """Find the (start, end, leading, lookup key, case shape, trailing) spans of matching words"""
+    spans = []
+    if pattern is not None:
+        for match in pattern.finditer(text):
+            leading, word, trailing = match.groups()
+            spans.append((match.start(), match.end(), leading, word.upper(), case_shape(word), trailing))
+    return spans
+
+
+class WordTranslator:
+    """Translates individual words, preserving their case and punctuation
+
+    A compiled regex tokenizes the text in one pass, splitting leading and
+    trailing punctuation off each whitespace-separated word and matching
+    the word part against the dictionary, so words without a translation
+    never reach Python code. The dictionary can be a plain dict or a
+    memory-mapped CompiledDictionary with a prebuilt pattern.
+    """
+
+    def __init__(self, translations: Mapping[str, str], pattern_source: Optional[str] = None):
+        self.translations = translations
+        # Upper, title and lower case forms of each translation, filled on first use
+        self.forms = {}
+        self._all_forms = False
+
+        if pattern_source is None:
+            pattern_source = word_pattern_source(translations)
+
+        self._pattern = compile_word_pattern(pattern_source)
+
+    def translate(self, text: str) -> str:
+        """Translate every dictionary word in the text"""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
+
+    def translate_spans(self, text: str, spans: List[Tuple[int, int, str, str, int, str]]) -> str:
+        """Translate the words of a find_word_spans result, giving the same result as translate()
+
+        The spans may come from a pattern covering several dictionaries, so
+        words this dictionary does not have are left as they are.
+        """
+        forms_by_key = self.all_forms()
+        pieces = []
+        position = 0
+        for start, end, leading, key, shape, trailing in spans:
+            forms = forms_by_key.get(key)
+            if forms is not None:
+                pieces.append(text[position:start])
+                pieces.append(leading + forms[shape] + trailing)
+                position = end
+        if not pieces:
+            return text
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+    def all_forms(self) -> Dict[str, Tuple[str, str, str]]:
+        """Get the case forms of every word that can be looked up, filling in the missing ones"""
+        if not self._all_forms:
+            for key in lookup_words(self.translations):
+                if key not in self.forms:
+                    translated = self.translations[key]
+                    self.forms[key] = (translated.upper(), translated.title(), translated.lower())
+            self._all_forms = True
+        return self.forms
+
+    def _replace(self, match: "re.Match") -> str:
+        """Translate one matched word, keeping its surrounding punctuation"""
+        leading, word, trailing = match.groups()
+        key = word.upper()
+        forms = self.forms.get(key)
+        if forms is None:
+            translated = self.translations.get(key)
+            if translated is None:
+                return match.group(0)
+            forms = self.forms[key] = (translated.upper(), translated.title(), translated.lower())
+        return leading + forms[case_shape(word)] + trailing
+
+
+class TranslationEngine:
+    """Translates commentary using lookup tables built once per language
+
+    Word dictionaries come from the compiled store (see
+    utils/translation_store.py) when it has been built, and from
+    get_comprehensive_translation_dict() otherwise.
+    """
+
+    def __init__(self, cache_size: int = 4096, cache_ttl: Optional[float] = None,
+                 store_path: Optional[str] = DEFAULT_STORE_PATH):
+        self.store_path = store_path
+        self._store = None
+        self._dictionaries = None
+        self._word_translators = {}
+        self._phrase_matchers = {}
+        self._batch_patterns = {}
+        self.cache = TranslationCache(cache_size, cache_ttl)
+
+    def translate(self, text: str, target_language: str) -> str:
+        """Translate a commentary line into the target language"""
+        return self.cache.get_or_compute(
+            text, target_language, lambda line: self._translate_uncached(line, target_language)
+        )
+
+    def has_dictionary(self, language: str) -> bool:
+        """Check whether a language has a word dictionary to translate with"""
+        return language != "Simplified" and len(self._get_word_translator(language).translations) > 0
+
+    def _translate_uncached(self, text: str, target_language: str) -> str:
+        """Translate a commentary line without using the cache"""
+        if target_language == "Simplified":
+            return self._simplify(text)
+
+        translated = normalize_text(self._translate_phrases(text, target_language))
+        return self._get_word_translator(target_language).translate(translated)
+
+    def translate_batch(self, lines: List[str], languages: List[str]) -> List[List[str]]:
+        """Translate many lines into many languages, returning a lines x languages matrix
+
+        Results come from and go into the result cache like translate().
+        On a miss each line is tokenized once, with one pattern holding the
+        words of every target language, and the word spans and lookup keys
+        are shared by all of them: each language only looks its own
+        precomputed word forms up by key. Only a language with a phrase in
+        the line has to translate the phrases and tokenize the result
+        again. Repeated lines within the batch are translated once.
+        """
+        matchers = [self._get_phrase_matcher(language) for language in languages]
+        translators = [None if language == "Simplified" else self._get_word_translator(language)
+                       for language in languages]
+        pattern = self._get_batch_pattern(languages, translators)
+
+        rows = {}
+        results = []
+        for line in lines:
+            row = rows.get(line)
+            if row is None:
+                row = rows[line] = self._translate_row(line, languages, matchers, translators, pattern)
+            results.append(list(row))
+        return results
+
+    def _translate_row(self, line: str, languages: List[str], matchers: List[PhraseMatcher],
+                       translators: List[Optional[WordTranslator]],
+                       pattern: Optional["re.Pattern"]) -> List[str]:
+        """Translate one line into every language of a batch"""
+        text = spans = None
+        row = []
+        for language, matcher, translator in zip(languages, matchers, translators):
+            found, translated = self.cache.lookup(line, language)
+            if not found:
+                if translator is None or matcher.contains_phrase(line):
+                    translated = self._translate_uncached(line, language)
+                else:
+                    if text is None:
+                        text = normalize_text(line)
+                        spans = find_word_spans(pattern, text)
+                    translated = translator.translate_spans(text, spans)
+                self.cache.store(line, language, translated)
+            row.append(translated)
+        return row
+
+    def _get_batch_pattern(self, languages: List[str],
+                           translators: List[Optional[WordTranslator]]) -> Optional["re.Pattern"]:
+        """Get the word pattern covering the dictionaries of a batch's languages"""
+        key = tuple(languages)
+        if key not in self._batch_patterns:
+            words = set()
+            for translator in translators:
+                if translator is not None:
+                    words.update(translator.all_forms())
+            self._batch_patterns[key] = compile_word_pattern(build_trie_pattern(sorted(words)))
+        return self._batch_patterns[key]
+
+    def _simplify(self, text: str) -> str:
+        """Replace complex terms with simpler ones"""
+        return self._get_phrase_matcher("Simplified").replace(text)
+
+    def _translate_phrases(self, text: str, target_language: str) -> str:
+        """Translate multi-word phrases before individual words"""
+        return self._get_phrase_matcher(target_language).replace(text)
+
+    def _get_phrase_matcher(self, target_language: str) -> PhraseMatcher:
+        """Get the phrase matcher for a language, compiling it on first use"""
+        matcher = self._phrase_matchers.get(target_language)
+        if matcher is None:
+            if target_language == "Simplified":
+                matcher = PhraseMatcher(SIMPLIFIED_REPLACEMENTS)
+            else:
+                matcher = PhraseMatcher(PHRASE_PATTERNS.get(target_language, {}))
+            self._phrase_matchers[target_language] = matcher
+        return matcher
+
+    def _get_word_translator(self, target_language: str) -> WordTranslator:
+        """Get the word translator for a language, building it on first use"""
+        translator = self._word_translators.get(target_language)
+        if translator is None:
+            if self._store is None and self.store_path:
+                self._store = open_translation_store(self.store_path) or False
+
+            compiled = self._store.get_dictionary(target_language) if self._store else None
+            if compiled is not None:
+                translator = WordTranslator(compiled, compiled.word_pattern)
             else:
-                translated_words.append(translated_word.lower())
-        else:
-            translated_words.append(word)
-    
-    return " ".join(translated_words)
+                if self._dictionaries is None:
+                    self._dictionaries = get_comprehensive_translation_dict()
+                translator = WordTranslator(self._dictionaries.get(target_language, {}))
+            self._word_translators[target_language] = translator
+        return translator
+
+
+# Shared engine so the dictionaries are only built once per process
+_engine = TranslationEngine()
+
+
+def get_translation_engine() -> TranslationEngine:
+    """Get the shared translation engine"""
+    return _engine
+
+
+def translate_text_comprehensive(text, target_language):
+    """Comprehensive translation function with extensive word coverage"""
+    return _engine.translate(text, target_language)
+
+
+def get_translation_cache_stats() -> Dict:
+    """Get hit, miss and eviction counters for the shared translation cache"""
+    return _engine.cache.stats()
+
+
+def configure_translation_cache(maxsize: int, ttl: Optional[float] = None):
+    """Resize the shared translation cache and set its TTL in seconds"""
+    _engine.cache.resize(maxsize, ttl)
 
 
+def translate_batch(lines: List[str], languages: List[str]) -> List[List[str]]:
+    """Translate commentary lines into several languages at once"""
+    return _engine.translate_batch(lines, languages)
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """Collapse runs of whitespace, as the word-by-word translation pass does"""
+    return " ".join(text.split())
+
+
+class TranslationCache:
+    """Bounded, thread-safe LRU cache for translation results
+
+    Entries are keyed by the exact (text, language) pair, so a cached
+    result is always the one computing it would give, and optionally expire
+    after ``ttl`` seconds. Hit, miss, eviction and expiration counters are
+    kept so the cache can be sized against real race traffic.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get_or_compute(self, text: str, language: str, compute: Callable[[str], Any]) -> Any:
+        """Get a cached result, computing it from the text on a miss"""
+        found, value = self.lookup(text, language)
+        if not found:
+            value = compute(text)
+            self.store(text, language, value)
+        return value
+
+    def lookup(self, text: str, language: str) -> Tuple[bool, Any]:
+        """Look up an entry, refreshing its position in the LRU order"""
+        key = (text, language)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, value
+
+    def store(self, text: str, language: str, value: Any):
+        """Store an entry, evicting the least recently used ones if full"""
+        if self.maxsize <= 0:
+            return
+
+        key = (text, language)
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def resize(self, maxsize: int, ttl: Optional[float] = None):
+        """Change the cache capacity and TTL, evicting entries if needed"""
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> Dict:
+        """Get cache usage counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,224 @@
+"""
+Compiled on-disk format for the translation dictionaries.
+
+The build step writes every language's dictionary into one binary file
+of sorted keys and values addressed through offset tables. At runtime the
+file is memory-mapped and looked up with a binary search, so nothing is
+parsed at startup and all Streamlit worker processes share the same
+pages through the OS page cache.
+
+The store records a hash of utils/translation.py, where the dictionaries
+are defined, and the length of its body. A store built from an older
+version of that file, or one that is cut short or cannot be read, is
+ignored and the dictionaries are built in memory instead, so edits never
+silently give old translations.
+
+Usage:
+    python -m utils.translation_store build
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional
+
+MAGIC = b"F1TD"
+VERSION = 2
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "assets", "translations.bin")
+DICTIONARY_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "translation.py")
+
+
+class CompiledDictionary(Mapping):
+    """Read-only view of one language's dictionary inside a memory-mapped store"""
+
+    def __init__(self, data: mmap.mmap, section: Dict, body_start: int):
+        self._data = data
+        self._count = section["count"]
+        self._keys_start = body_start + section["keys"]
+        self._values_start = body_start + section["values"]
+
+        view = memoryview(data)
+        table_length = 4 * (self._count + 1)
+        key_offsets = body_start + section["key_offsets"]
+        value_offsets = body_start + section["value_offsets"]
+        self._key_offsets = view[key_offsets:key_offsets + table_length].cast("I")
+        self._value_offsets = view[value_offsets:value_offsets + table_length].cast("I")
+
+        self._pattern_start = body_start + section["pattern"]
+        self._pattern_end = self._pattern_start + section["pattern_length"]
+
+        # Slices past the end of the file read as empty, so check every range is inside it
+        if (len(self._key_offsets) != self._count + 1 or len(self._value_offsets) != self._count + 1
+                or self._keys_start + self._key_offsets[-1] > len(data)
+                or self._values_start + self._value_offsets[-1] > len(data)
+                or self._pattern_end > len(data)):
+            raise ValueError("Translation store section is out of bounds")
+
+    @property
+    def word_pattern(self) -> str:
+        """Regex source matching the words that can be looked up"""
+        return self._data[self._pattern_start:self._pattern_end].decode("utf-8")
+
+    def __getitem__(self, key: str) -> str:
+        index = self._find(key.encode("utf-8"))
+        if index is None:
+            raise KeyError(key)
+        return self._value_at(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key_at(index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _find(self, key: bytes) -> Optional[int]:
+        """Binary search the sorted keys"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self._key_at(middle)
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _key_at(self, index: int) -> bytes:
+        """Get the encoded key at a position"""
+        start = self._keys_start + self._key_offsets[index]
+        return self._data[start:self._keys_start + self._key_offsets[index + 1]]
+
+    def _value_at(self, index: int) -> str:
+        """Get the decoded value at a position"""
+        start = self._values_start + self._value_offsets[index]
+        return self._data[start:self._values_start + self._value_offsets[index + 1]].decode("utf-8")
+
+
+class TranslationStore:
+    """Memory-mapped store holding the compiled dictionaries of every language"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a compiled translation store")
+        directory_length, = struct.unpack_from("<I", self._data, 4)
+        directory = json.loads(self._data[8:8 + directory_length].decode("utf-8"))
+        if directory["version"] != VERSION or directory["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was built for a different format, rebuild it")
+
+        self._body_start = 8 + directory_length
+        if len(self._data) != self._body_start + directory["body_length"]:
+            raise ValueError(f"{path} is truncated or has trailing data, rebuild it")
+
+        self.source_hash = directory.get("source_hash")
+        self._sections = directory["languages"]
+        # Mapping every section up front checks all of them before the store is used
+        self._dictionaries = {
+            language: CompiledDictionary(self._data, section, self._body_start)
+            for language, section in self._sections.items()
+        }
+
+    def languages(self) -> List[str]:
+        """Get the languages in the store"""
+        return list(self._sections)
+
+    def get_dictionary(self, language: str) -> Optional[CompiledDictionary]:
+        """Get the compiled dictionary for a language"""
+        return self._dictionaries.get(language)
+
+
+def source_file_hash(source_path: str = DICTIONARY_SOURCE_PATH) -> Optional[str]:
+    """Hash of the file the dictionaries are defined in"""
+    try:
+        with open(source_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def open_translation_store(path: str = DEFAULT_STORE_PATH,
+                           source_path: Optional[str] = DICTIONARY_SOURCE_PATH) -> Optional[TranslationStore]:
+    """Open the compiled store, or return None if it is missing, unreadable or out of date"""
+    if not os.path.exists(path):
+        return None
+    try:
+        store = TranslationStore(path)
+    except (ValueError, KeyError, TypeError, IndexError, struct.error):
+        # Corrupt, truncated, or written by another format version
+        return None
+    if source_path is not None and store.source_hash != source_file_hash(source_path):
+        return None
+    return store
+
+
+def build_translation_store(dictionaries: Dict[str, Dict[str, str]], path: str = DEFAULT_STORE_PATH,
+                            source_hash: Optional[str] = None):
+    """Compile dictionaries into the binary store format, recording the hash of their source"""
+    # Imported here to avoid a circular import with utils.translation
+    from utils.translation import word_pattern_source
+
+    body = bytearray()
+    sections = {}
+
+    for language, translations in dictionaries.items():
+        entries = sorted((key.encode("utf-8"), value.encode("utf-8")) for key, value in translations.items())
+        pattern = word_pattern_source(translations).encode("utf-8")
+
+        section = {"count": len(entries)}
+        for name, blobs in (("key", [key for key, _ in entries]), ("value", [value for _, value in entries])):
+            offsets = array("I", [0])
+            for blob in blobs:
+                offsets.append(offsets[-1] + len(blob))
+            section[name + "_offsets"] = len(body)
+            body += offsets.tobytes()
+            section[name + "s"] = len(body)
+            body += b"".join(blobs)
+            # Keep the next offset table aligned for memoryview.cast
+            body += b"\0" * (-len(body) % 4)
+
+        section["pattern"] = len(body)
+        section["pattern_length"] = len(pattern)
+        body += pattern + b"\0" * (-len(pattern) % 4)
+        sections[language] = section
+
+    directory = json.dumps({"version": VERSION, "byteorder": sys.byteorder, "source_hash": source_hash,
+                            "body_length": len(body), "languages": sections}).encode("utf-8")
+    # Pad the directory so the body, and every offset table in it, stays 4-byte aligned
+    directory += b" " * (-len(directory) % 4)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(directory)) + directory + bytes(body))
+    os.replace(temporary_path, path)
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Compile the F1 translation dictionaries")
+    parser.add_argument("command", choices=["build"], help="Action to run")
+    parser.add_argument("-o", "--output", default=DEFAULT_STORE_PATH, help="Path of the compiled store")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    from utils.translation import get_comprehensive_translation_dict
+
+    dictionaries = get_comprehensive_translation_dict()
+    build_translation_store(dictionaries, args.output, source_file_hash())
+    print(f"✅ Compiled {len(dictionaries)} languages into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())